@@ -11,6 +11,8 @@ This is fundamental to understanding gauge symmetry emergence in TRD.
 """
 
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # figures are only saved, never shown
 import matplotlib.pyplot as plt
 from matplotlib.patches import FancyArrowPatch, Circle
 import matplotlib.patches as mpatches
@@ -19,10 +21,19 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.style import COLORS, apply_trd_style
+from utils.style import BBOX_STYLES, COLORS, apply_trd_style, prepare_figure
 
+# Unit circle for the circulation indicator, computed once at import
+_THETA = np.linspace(0, 2*np.pi, 100)
+_COS_T, _SIN_T = np.cos(_THETA), np.sin(_THETA)
 
-def generate_helmholtz():
+
+def quiver_grid_size(width_in, dpi, min_px_per_arrow=60, min_n=8, max_n=12):
+    """Arrows per side that the target resolution can actually resolve."""
+    return int(np.clip(width_in * dpi // min_px_per_arrow, min_n, max_n))
+
+
+def generate_helmholtz(dpi=150, fig=None):
     """
     Generate the Helmholtz decomposition visualization.
 
@@ -30,39 +41,52 @@ def generate_helmholtz():
     1. Original field J
     2. Longitudinal component J_L (radial/irrotational)
     3. Transverse component J_T (circular/solenoidal)
+
+    Parameters
+    ----------
+    dpi : int, default 150
+        Resolution the figure will be saved at; low-resolution previews
+        get a coarser arrow grid.
+    fig : matplotlib.figure.Figure, optional
+        Existing figure to clear and draw into (for batch builds).
     """
-    fig, axes = plt.subplots(1, 3, figsize=(15, 5), dpi=150)
-    fig.patch.set_facecolor(COLORS['background'])
+    c_matter = COLORS['matter']
 
-    # Grid for vector field
-    x = np.linspace(-2, 2, 12)
-    y = np.linspace(-2, 2, 12)
+    fig, axes = prepare_figure(fig, 1, 3, figsize=(13.52, 5.03),
+                               facecolor=COLORS['background'])
+
+    # Grid for vector field, sized for 5 in of figure width per panel
+    n = quiver_grid_size(5, dpi)
+    x = np.linspace(-2, 2, n)
+    y = np.linspace(-2, 2, n)
     X, Y = np.meshgrid(x, y)
 
+    # Scratch buffers for the normalized arrows, shared by all three panels
+    # (quiver copies U, V and C, so they can be overwritten after each call)
+    denom = np.empty_like(X)
+    U = np.empty_like(X)
+    V = np.empty_like(X)
+
     # =========================================================================
     # Panel 1: Original field J (combination)
     # =========================================================================
     ax1 = axes[0]
 
-    # Combined field: radial + rotational
-    r = np.sqrt(X**2 + Y**2) + 0.1
-    # Longitudinal (radial outward)
-    Jx_L = X / r**2
-    Jy_L = Y / r**2
-    # Transverse (rotational)
-    Jx_T = -Y / r**1.5
-    Jy_T = X / r**1.5
-
-    # Combined
-    Jx = Jx_L + Jx_T
-    Jy = Jy_L + Jy_T
+    # Combined field: radial (X, Y)/r^2 + rotational (-Y, X)/r^1.5
+    rho = np.hypot(X, Y)
+    r = rho + 0.1
+    ri2 = 1.0 / (r * r)
+    ri15 = ri2 * np.sqrt(r)
+    Jx = X * ri2 - Y * ri15
+    Jy = Y * ri2 + X * ri15
 
     # Normalize for display
-    mag = np.sqrt(Jx**2 + Jy**2)
-    Jx_norm = Jx / (mag + 0.1)
-    Jy_norm = Jy / (mag + 0.1)
+    mag = np.hypot(Jx, Jy)
+    np.add(mag, 0.1, out=denom)
+    np.divide(Jx, denom, out=U)
+    np.divide(Jy, denom, out=V)
 
-    ax1.quiver(X, Y, Jx_norm, Jy_norm, mag, cmap='viridis',
+    ax1.quiver(X, Y, U, V, mag, cmap='viridis',
                scale=25, width=0.008, alpha=0.8)
     ax1.set_xlim(-2.5, 2.5)
     ax1.set_ylim(-2.5, 2.5)
@@ -74,23 +98,28 @@ def generate_helmholtz():
     # Add equation
     ax1.text(0, -2.2, r'$\mathbf{J} = \mathbf{J}_L + \mathbf{J}_T$',
              fontsize=12, ha='center',
-             bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.9))
+             bbox=BBOX_STYLES['label'])
 
     # =========================================================================
     # Panel 2: Longitudinal component J_L (curl-free)
     # =========================================================================
     ax2 = axes[1]
 
-    # Normalize
-    mag_L = np.sqrt(Jx_L**2 + Jy_L**2)
-    Jx_L_norm = Jx_L / (mag_L + 0.1)
-    Jy_L_norm = Jy_L / (mag_L + 0.1)
+    # Longitudinal (radial outward)
+    Jx_L = X * ri2
+    Jy_L = Y * ri2
+
+    # Normalize (|J_L| = rho / r^2 since J_L is parallel to (X, Y))
+    mag_L = rho * ri2
+    np.add(mag_L, 0.1, out=denom)
+    np.divide(Jx_L, denom, out=U)
+    np.divide(Jy_L, denom, out=V)
 
-    ax2.quiver(X, Y, Jx_L_norm, Jy_L_norm, mag_L, cmap='Reds',
+    ax2.quiver(X, Y, U, V, mag_L, cmap='Reds',
                scale=25, width=0.008, alpha=0.8)
 
     # Add source point at center
-    ax2.scatter([0], [0], c=COLORS['matter'], s=200, zorder=10,
+    ax2.scatter([0], [0], c=c_matter, s=200, zorder=10,
                 edgecolors='black', linewidths=2, marker='o')
     ax2.text(0.2, 0.2, 'Source', fontsize=10)
 
@@ -98,7 +127,7 @@ def generate_helmholtz():
     ax2.set_ylim(-2.5, 2.5)
     ax2.set_aspect('equal')
     ax2.set_title(r'Longitudinal $\mathbf{J}_L$', fontsize=14,
-                  fontweight='bold', color=COLORS['matter'])
+                  fontweight='bold', color=c_matter)
     ax2.set_xlabel('x')
 
     # Properties
@@ -111,18 +140,22 @@ def generate_helmholtz():
     # =========================================================================
     ax3 = axes[2]
 
-    # Normalize
-    mag_T = np.sqrt(Jx_T**2 + Jy_T**2)
-    Jx_T_norm = Jx_T / (mag_T + 0.1)
-    Jy_T_norm = Jy_T / (mag_T + 0.1)
+    # Transverse (rotational)
+    Jx_T = -Y * ri15
+    Jy_T = X * ri15
+
+    # Normalize (|J_T| = rho / r^1.5 since J_T is perpendicular to (X, Y))
+    mag_T = rho * ri15
+    np.add(mag_T, 0.1, out=denom)
+    np.divide(Jx_T, denom, out=U)
+    np.divide(Jy_T, denom, out=V)
 
-    ax3.quiver(X, Y, Jx_T_norm, Jy_T_norm, mag_T, cmap='Blues',
+    ax3.quiver(X, Y, U, V, mag_T, cmap='Blues',
                scale=25, width=0.008, alpha=0.8)
 
     # Add circulation indicator
-    theta = np.linspace(0, 2*np.pi, 100)
     circle_r = 1.0
-    ax3.plot(circle_r * np.cos(theta), circle_r * np.sin(theta),
+    ax3.plot(circle_r * _COS_T, circle_r * _SIN_T,
              'b--', linewidth=2, alpha=0.5)
     ax3.annotate('', xy=(0, 1.0), xytext=(0.3, 0.95),
                 arrowprops=dict(arrowstyle='->', color='blue', lw=2))
@@ -143,18 +176,21 @@ def generate_helmholtz():
     # Overall annotations
     # =========================================================================
     fig.suptitle('Helmholtz Decomposition of Vector Fields',
-                fontsize=16, fontweight='bold', y=1.02)
+                fontsize=16, fontweight='bold', y=0.979)
 
     # Explanation
     explanation = (
         "Any vector field can be uniquely decomposed into curl-free and divergence-free parts.\n"
         "In TRD, this explains U(1) gauge symmetry: J_L is constrained by charge, J_T has 2 physical modes (photon polarizations)."
     )
-    fig.text(0.5, -0.02, explanation, ha='center', fontsize=10,
-             bbox=dict(boxstyle='round,pad=0.5', facecolor='white',
-                      edgecolor='gray', alpha=0.9))
+    fig.text(0.5, 0.035, explanation, ha='center', va='bottom', fontsize=10,
+             bbox=BBOX_STYLES['caption'])
 
-    plt.tight_layout(rect=[0, 0.05, 1, 0.95])
+    # Margins as measured from tight_layout(rect=[0, 0.1, 1, 0.93]), with the
+    # bottom raised so the x labels clear the caption box, then fitted to the
+    # equal-aspect panels so the figure has no empty side borders
+    fig.subplots_adjust(left=0.044, right=0.993, bottom=0.217, top=0.823,
+                        wspace=0.605)
 
     return fig
 
@@ -162,7 +198,7 @@ def generate_helmholtz():
 if __name__ == '__main__':
     fig = generate_helmholtz()
     output_path = Path(__file__).parent.parent / 'ch00' / 'fig_2_1_helmholtz.png'
-    fig.savefig(output_path, dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
+    fig.savefig(output_path, dpi=150, facecolor='white', edgecolor='none',
+                pil_kwargs={'compress_level': 1, 'optimize': False})
     print(f"Saved: {output_path}")
     plt.close(fig)
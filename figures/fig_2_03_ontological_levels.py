@@ -11,6 +11,8 @@ This represents the three-layer ontology where:
 """
 
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # figures are only saved, never shown
 import matplotlib.pyplot as plt
 from matplotlib.patches import FancyBboxPatch, FancyArrowPatch, Circle, Ellipse
 import matplotlib.patches as mpatches
@@ -19,10 +21,10 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.style import COLORS, apply_trd_style
+from utils.style import BBOX_STYLES, COLORS, apply_trd_style, prepare_figure
 
 
-def generate_ontological_levels():
+def generate_ontological_levels(fig=None):
     """
     Generate the ontological levels hierarchy diagram.
 
@@ -30,9 +32,18 @@ def generate_ontological_levels():
     1. Void (foundational substrate)
     2. Flux (dispositional field)
     3. Manifestation (actualized states)
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure, optional
+        Existing figure to clear and draw into (for batch builds).
     """
-    fig, ax = plt.subplots(figsize=(12, 10), dpi=150)
-    fig.patch.set_facecolor(COLORS['background'])
+    fig, ax = prepare_figure(fig, figsize=(11, 7.9),
+                             facecolor=COLORS['background'])
+
+    # Keep the axes at 9.3 x 7.7 in, with room on the right for the analogy
+    # labels, which overhang the axes
+    fig.subplots_adjust(left=0.009, right=0.855, bottom=0.013, top=0.987)
 
     ax.set_xlim(0, 1)
     ax.set_ylim(0, 1)
@@ -108,10 +119,10 @@ def generate_ontological_levels():
                 layer['subtitle'], fontsize=11,
                 ha='center', va='top', style='italic', color='gray')
 
-        # Description bullets (left side)
-        for j, desc in enumerate(layer['description']):
-            ax.text(0.2, layer['y'] + layer['height'] - 0.09 - j*0.035,
-                    f'• {desc}', fontsize=9, ha='left', va='top')
+        # Description bullets (left side), laid out as one text block
+        ax.text(0.2, layer['y'] + layer['height'] - 0.08,
+                '\n'.join(f'• {desc}' for desc in layer['description']),
+                fontsize=9, ha='left', va='top', linespacing=2.5)
 
         # Analogy (right side)
         ax.text(0.82, layer['y'] + layer['height']/2,
@@ -154,8 +165,7 @@ def generate_ontological_levels():
         "one substance, multiple modes of being."
     )
     ax.text(0.5, 0.03, note, fontsize=10, ha='center', va='bottom',
-            bbox=dict(boxstyle='round,pad=0.5', facecolor='white',
-                     edgecolor='gray', alpha=0.9))
+            bbox=BBOX_STYLES['caption'])
 
     # Side labels
     ax.text(0.05, 0.25, 'LESS\nACTUAL', fontsize=10, ha='center', va='center',
@@ -171,7 +181,7 @@ def generate_ontological_levels():
 if __name__ == '__main__':
     fig = generate_ontological_levels()
     output_path = Path(__file__).parent.parent / 'ch00' / 'fig_2_3_ontological_levels.png'
-    fig.savefig(output_path, dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
+    fig.savefig(output_path, dpi=150, facecolor='white', edgecolor='none',
+                pil_kwargs={'compress_level': 1, 'optimize': False})
     print(f"Saved: {output_path}")
     plt.close(fig)
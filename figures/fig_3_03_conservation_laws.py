@@ -5,9 +5,9 @@ Diagram showing which quantities are conserved in TRD
 and how conservation emerges from the update rules.
 """
 
-import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.patches import FancyBboxPatch, Circle, FancyArrowPatch
+from matplotlib.collections import EllipseCollection, PatchCollection
+from matplotlib.patches import FancyBboxPatch
 import sys
 from pathlib import Path
 
@@ -18,8 +18,11 @@ from utils.style import COLORS
 
 def generate_conservation_laws():
     """Generate the conservation laws visualization."""
-    fig, ax = plt.subplots(figsize=(12, 10), dpi=150)
+    # The axes fill the figure, sized as the default-margin axes of a
+    # 12 x 10 figure, so the PNG needs no tight-bbox crop
+    fig, ax = plt.subplots(figsize=(9.3, 7.7))
     fig.patch.set_facecolor(COLORS['background'])
+    fig.subplots_adjust(left=0, right=1, bottom=0, top=1)
     ax.set_xlim(0, 12)
     ax.set_ylim(0, 10)
     ax.axis('off')
@@ -46,12 +49,13 @@ def generate_conservation_laws():
     ax.text(3, 8.5, 'CONSERVED', fontsize=12, fontweight='bold', ha='center',
             color='green')
 
+    # Boxes of both columns are gathered and added as one collection
+    boxes = []
     for i, (name, desc, color, _) in enumerate(conserved):
         y = 7.5 - i * 1.4
-        box = FancyBboxPatch((0.5, y - 0.5), 5, 1,
-                            boxstyle="round,pad=0.02",
-                            facecolor=color, edgecolor='green', linewidth=2)
-        ax.add_patch(box)
+        boxes.append(FancyBboxPatch((0.5, y - 0.5), 5, 1,
+                                    boxstyle="round,pad=0.02",
+                                    facecolor=color, edgecolor='green', linewidth=2))
         ax.text(1, y, name, fontsize=11, fontweight='bold', va='center')
         ax.text(3, y, desc, fontsize=9, va='center')
 
@@ -61,22 +65,27 @@ def generate_conservation_laws():
 
     for i, (name, desc, color) in enumerate(not_conserved):
         y = 7.5 - i * 1.4
-        box = FancyBboxPatch((6.5, y - 0.5), 5, 1,
-                            boxstyle="round,pad=0.02",
-                            facecolor=color, edgecolor='gray', linewidth=2)
-        ax.add_patch(box)
+        boxes.append(FancyBboxPatch((6.5, y - 0.5), 5, 1,
+                                    boxstyle="round,pad=0.02",
+                                    facecolor=color, edgecolor='gray', linewidth=2))
         ax.text(7, y, name, fontsize=11, fontweight='bold', va='center')
         ax.text(9, y, desc, fontsize=9, va='center')
 
+    ax.add_collection(PatchCollection(boxes, match_original=True))
+
     # Example: charge conservation in annihilation
     ax.text(6, 1.8, 'Example: Charge Conservation in Annihilation', fontsize=11,
             fontweight='bold', ha='center')
 
     # Before
+    # Particles before and after, drawn as one collection
+    ax.add_collection(EllipseCollection(
+        0.5, 0.5, 0, units='xy', offsets=[(1.5, 0.7), (3.5, 0.7), (6.5, 0.7), (8.5, 0.7)],
+        offset_transform=ax.transData, edgecolors='black',
+        facecolors=[COLORS['matter'], COLORS['antimatter'], COLORS['void'], COLORS['void']]))
+
     ax.text(2.5, 1.2, 'Before:', fontsize=10, ha='center')
-    ax.add_patch(Circle((1.5, 0.7), 0.25, facecolor=COLORS['matter'], edgecolor='black'))
     ax.text(1.5, 0.7, '+', fontsize=12, ha='center', va='center', color='white')
-    ax.add_patch(Circle((3.5, 0.7), 0.25, facecolor=COLORS['antimatter'], edgecolor='black'))
     ax.text(3.5, 0.7, '-', fontsize=12, ha='center', va='center', color='white')
     ax.text(2.5, 0.2, 'Net: +1 + (-1) = 0', fontsize=9, ha='center')
 
@@ -86,9 +95,7 @@ def generate_conservation_laws():
 
     # After
     ax.text(7.5, 1.2, 'After:', fontsize=10, ha='center')
-    ax.add_patch(Circle((6.5, 0.7), 0.25, facecolor=COLORS['void'], edgecolor='black'))
     ax.text(6.5, 0.7, '0', fontsize=10, ha='center', va='center')
-    ax.add_patch(Circle((8.5, 0.7), 0.25, facecolor=COLORS['void'], edgecolor='black'))
     ax.text(8.5, 0.7, '0', fontsize=10, ha='center', va='center')
     ax.text(7.5, 0.2, 'Net: 0 + 0 = 0', fontsize=9, ha='center')
 
@@ -102,7 +109,6 @@ if __name__ == '__main__':
     fig = generate_conservation_laws()
     output_path = Path(__file__).parent.parent / 'ch01' / 'fig_3_3_conservation_laws.png'
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(output_path, dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
+    fig.savefig(output_path, dpi=150, facecolor='white', edgecolor='none')
     print(f"Saved: {output_path}")
     plt.close(fig)
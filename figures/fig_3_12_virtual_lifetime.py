@@ -6,6 +6,8 @@ and lifetime (Heisenberg uncertainty).
 """
 
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # figures are only saved, never shown
 import matplotlib.pyplot as plt
 from matplotlib.patches import Rectangle
 import sys
@@ -13,13 +15,20 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.style import COLORS
+from utils.style import COLORS, prepare_figure
 
 
-def generate_virtual_lifetime():
-    """Generate the virtual particle lifetime visualization."""
-    fig, (ax_left, ax_right) = plt.subplots(1, 2, figsize=(14, 6), dpi=150)
-    fig.patch.set_facecolor(COLORS['background'])
+def generate_virtual_lifetime(fig=None):
+    """
+    Generate the virtual particle lifetime visualization.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure, optional
+        Existing figure to clear and draw into (for batch builds).
+    """
+    fig, (ax_left, ax_right) = prepare_figure(fig, 1, 2, figsize=(14, 6),
+                                              facecolor=COLORS['background'])
 
     # Left: Energy-time uncertainty plot
     ax = ax_left
@@ -94,7 +103,9 @@ def generate_virtual_lifetime():
     fig.suptitle('Virtual Particles: Borrowed Energy, Limited Time',
                 fontsize=14, fontweight='bold', y=0.98)
 
-    plt.tight_layout(rect=[0, 0, 1, 0.95])
+    # Margins as measured from tight_layout(rect=[0, 0, 1, 0.95])
+    fig.subplots_adjust(left=0.056, right=0.989, bottom=0.103, top=0.832,
+                        wspace=0.088)
     return fig
 
 
@@ -102,7 +113,6 @@ if __name__ == '__main__':
     fig = generate_virtual_lifetime()
     output_path = Path(__file__).parent.parent / 'ch02' / 'fig_3_12_virtual_lifetime.png'
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(output_path, dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
+    fig.savefig(output_path, dpi=150, facecolor='white', edgecolor='none')
     print(f"Saved: {output_path}")
     plt.close(fig)
@@ -6,20 +6,29 @@ wave propagation through discrete lattice.
 """
 
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # figures are only saved, never shown
 import matplotlib.pyplot as plt
-from matplotlib.patches import Circle
+from matplotlib.collections import EllipseCollection, LineCollection
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.style import COLORS
+from utils.style import COLORS, prepare_figure
 
 
-def generate_phonon_propagation():
-    """Generate the phonon propagation visualization."""
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10), dpi=150)
-    fig.patch.set_facecolor(COLORS['background'])
+def generate_phonon_propagation(fig=None):
+    """
+    Generate the phonon propagation visualization.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure, optional
+        Existing figure to clear and draw into (for batch builds).
+    """
+    fig, axes = prepare_figure(fig, 2, 2, figsize=(14, 10),
+                               facecolor=COLORS['background'])
 
     # Panel 1: Longitudinal (acoustic) mode
     ax = axes[0, 0]
@@ -34,14 +43,19 @@ def generate_phonon_propagation():
     k = 2 * np.pi / 5  # wavevector
     amplitude = 0.4
 
-    for i in range(n_atoms):
-        # Displacement along propagation direction
-        displacement = amplitude * np.sin(k * i)
-        x = i + displacement
-        ax.add_patch(Circle((x, 0), 0.3, facecolor=COLORS['matter'],
-                           edgecolor='black', linewidth=1))
-        # Equilibrium position marker
-        ax.plot([i, i], [-0.1, 0.1], 'k--', alpha=0.3)
+    # Displacement along propagation direction, shared by both chain panels
+    sites = np.arange(n_atoms)
+    displacement = amplitude * np.sin(k * sites)
+
+    ax.add_collection(EllipseCollection(
+        0.6, 0.6, 0, units='xy',
+        offsets=np.column_stack([sites + displacement, np.zeros(n_atoms)]),
+        offset_transform=ax.transData, facecolors=COLORS['matter'],
+        edgecolors='black', linewidths=1))
+    # Equilibrium position markers
+    ax.add_collection(LineCollection(
+        [[(i, -0.1), (i, 0.1)] for i in sites],
+        colors='k', linestyles='--', alpha=0.3))
 
     ax.annotate('', xy=(14, 1.5), xytext=(0, 1.5),
                arrowprops=dict(arrowstyle='->', color='blue', lw=2))
@@ -55,14 +69,16 @@ def generate_phonon_propagation():
     ax.axis('off')
     ax.set_title('Transverse (Optical) Mode', fontsize=11, fontweight='bold')
 
-    for i in range(n_atoms):
-        # Displacement perpendicular to propagation
-        displacement = amplitude * np.sin(k * i)
-        y = displacement
-        ax.add_patch(Circle((i, y), 0.3, facecolor=COLORS['antimatter'],
-                           edgecolor='black', linewidth=1))
-        # Equilibrium position marker
-        ax.plot([i-0.1, i+0.1], [0, 0], 'k--', alpha=0.3)
+    # Same displacement, perpendicular to propagation
+    ax.add_collection(EllipseCollection(
+        0.6, 0.6, 0, units='xy',
+        offsets=np.column_stack([sites, displacement]),
+        offset_transform=ax.transData, facecolors=COLORS['antimatter'],
+        edgecolors='black', linewidths=1))
+    # Equilibrium position markers
+    ax.add_collection(LineCollection(
+        [[(i - 0.1, 0), (i + 0.1, 0)] for i in sites],
+        colors='k', linestyles='--', alpha=0.3))
 
     ax.annotate('', xy=(14, 1.5), xytext=(0, 1.5),
                arrowprops=dict(arrowstyle='->', color='blue', lw=2))
@@ -71,7 +87,7 @@ def generate_phonon_propagation():
     # Panel 3: Dispersion relation
     ax = axes[1, 0]
 
-    k_vals = np.linspace(0, np.pi, 100)
+    k_vals = np.linspace(0, np.pi, 60)
 
     # Acoustic branch: omega ~ |k| for small k
     omega_acoustic = 2 * np.sin(k_vals / 2)
@@ -84,9 +100,6 @@ def generate_phonon_propagation():
     ax.plot(k_vals, omega_optical, color=COLORS['antimatter'], linewidth=2,
             label='Optical branch')
 
-    ax.axhline(y=0, color='gray', linestyle='-', linewidth=0.5)
-    ax.axvline(x=0, color='gray', linestyle='-', linewidth=0.5)
-
     ax.set_xlabel('Wavevector k', fontsize=10)
     ax.set_ylabel('Frequency omega', fontsize=10)
     ax.set_title('Phonon Dispersion Relation', fontsize=11, fontweight='bold')
@@ -94,9 +107,9 @@ def generate_phonon_propagation():
     ax.set_ylim(0, 2.5)
     ax.set_xticks([0, np.pi/2, np.pi])
     ax.set_xticklabels(['0', 'pi/2', 'pi'])
-    ax.legend(loc='upper right', fontsize=9)
+    ax.legend(loc='upper right', fontsize=9, frameon=False)
 
-    # Remove top and right spines
+    # Remove top and right spines; the remaining ones mark omega = 0 and k = 0
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
 
@@ -107,21 +120,24 @@ def generate_phonon_propagation():
     ax.axis('off')
     ax.set_title('TRD Phonon Model', fontsize=11, fontweight='bold')
 
-    # Draw lattice with flux connections
-    for i in range(5):
-        for j in range(5):
-            x = 2 + i * 1.5
-            y = 2 + j * 1.5
-
-            # Atom
-            ax.add_patch(Circle((x, y), 0.25, facecolor=COLORS['matter'],
-                               edgecolor='black', linewidth=1))
-
-            # Flux connections (springs)
-            if i < 4:
-                ax.plot([x + 0.25, x + 1.25], [y, y], 'b-', linewidth=1, alpha=0.5)
-            if j < 4:
-                ax.plot([x, x], [y + 0.25, y + 1.25], 'b-', linewidth=1, alpha=0.5)
+    # Draw lattice atoms as one collection. Sizes are in data units, so
+    # they stretch with the non-square axes exactly as Circle patches did.
+    I, J = np.meshgrid(np.arange(5), np.arange(5), indexing='ij')
+    X, Y = 2 + I * 1.5, 2 + J * 1.5
+    ax.add_collection(EllipseCollection(
+        0.5, 0.5, 0, units='xy',
+        offsets=np.column_stack([X.ravel(), Y.ravel()]),
+        offset_transform=ax.transData, facecolors=COLORS['matter'],
+        edgecolors='black', linewidths=1))
+
+    # Flux connections (springs) to the right and upper neighbours
+    springs_h = np.stack([np.stack([X[:4] + 0.25, Y[:4]], axis=-1),
+                          np.stack([X[:4] + 1.25, Y[:4]], axis=-1)], axis=-2)
+    springs_v = np.stack([np.stack([X[:, :4], Y[:, :4] + 0.25], axis=-1),
+                          np.stack([X[:, :4], Y[:, :4] + 1.25], axis=-1)], axis=-2)
+    for springs in (springs_h, springs_v):
+        ax.add_collection(LineCollection(springs.reshape(-1, 2, 2), colors='b',
+                                         linewidths=1, alpha=0.5))
 
     # Add flux wave overlay
     for i in range(5):
@@ -145,7 +161,9 @@ def generate_phonon_propagation():
     fig.suptitle('Phonon Propagation: Lattice Vibrations as Flux Waves',
                 fontsize=14, fontweight='bold')
 
-    plt.tight_layout(rect=[0, 0, 1, 0.95])
+    # Margins as measured from tight_layout(rect=[0, 0, 1, 0.95])
+    fig.subplots_adjust(left=0.047, right=0.989, bottom=0.059, top=0.901,
+                        wspace=0.033, hspace=-0.170)
     return fig
 
 
@@ -153,7 +171,6 @@ if __name__ == '__main__':
     fig = generate_phonon_propagation()
     output_path = Path(__file__).parent.parent / 'ch03' / 'fig_3_20_phonon_propagation.png'
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(output_path, dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
+    fig.savefig(output_path, dpi=150, facecolor='white', edgecolor='none')
     print(f"Saved: {output_path}")
     plt.close(fig)
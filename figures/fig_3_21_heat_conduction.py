@@ -6,8 +6,10 @@ electron mechanisms in TRD framework.
 """
 
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # figures are only saved, never shown
 import matplotlib.pyplot as plt
-from matplotlib.patches import Circle, FancyArrowPatch, Rectangle
+from matplotlib.collections import EllipseCollection
 from matplotlib.colors import LinearSegmentedColormap
 import sys
 from pathlib import Path
@@ -16,15 +18,16 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.style import COLORS
 
+# Custom hot-cold colormap
+_HOT_CMAP = LinearSegmentedColormap.from_list(
+    'hot_cold', ['#0000FF', '#00FFFF', '#00FF00', '#FFFF00', '#FF0000'])
+
 
 def generate_heat_conduction():
     """Generate the heat conduction visualization."""
     fig, axes = plt.subplots(2, 2, figsize=(14, 10), dpi=150)
     fig.patch.set_facecolor(COLORS['background'])
-
-    # Custom hot-cold colormap
-    colors_hot = ['#0000FF', '#00FFFF', '#00FF00', '#FFFF00', '#FF0000']
-    hot_cmap = LinearSegmentedColormap.from_list('hot_cold', colors_hot)
+    rng = np.random.default_rng(42)
 
     # Panel 1: Temperature gradient in lattice
     ax = axes[0, 0]
@@ -34,21 +37,18 @@ def generate_heat_conduction():
     ax.axis('off')
     ax.set_title('Temperature Gradient in Lattice', fontsize=11, fontweight='bold')
 
-    # Draw atoms with temperature coloring
+    # Draw atoms with temperature coloring, as one collection
     n_x, n_y = 12, 6
-    for i in range(n_x):
-        for j in range(n_y):
-            # Temperature decreases from left to right
-            temp = 1 - i / (n_x - 1)
-            color = hot_cmap(temp)
-
-            # Vibration amplitude proportional to temperature
-            amplitude = 0.15 * temp
-            offset_x = amplitude * np.random.randn()
-            offset_y = amplitude * np.random.randn()
-
-            ax.add_patch(Circle((i + offset_x, j + offset_y), 0.2,
-                               facecolor=color, edgecolor='black', linewidth=0.5))
+    I, J = np.meshgrid(np.arange(n_x), np.arange(n_y), indexing='ij')
+    # Temperature decreases from left to right
+    temp = 1 - I / (n_x - 1)
+    # Vibration amplitude proportional to temperature
+    offsets = 0.15 * temp[..., None] * rng.standard_normal((n_x, n_y, 2))
+    offsets += np.stack([I, J], axis=-1)
+    ax.add_collection(EllipseCollection(
+        0.4, 0.4, 0, units='xy', offsets=offsets.reshape(-1, 2),
+        offset_transform=ax.transData, facecolors=_HOT_CMAP(temp.ravel()),
+        edgecolors='black', linewidths=0.5))
 
     ax.text(0, -0.7, 'HOT', fontsize=10, ha='center', color='red', fontweight='bold')
     ax.text(11, -0.7, 'COLD', fontsize=10, ha='center', color='blue', fontweight='bold')
@@ -65,22 +65,27 @@ def generate_heat_conduction():
     ax.axis('off')
     ax.set_title('Phonon Heat Transport', fontsize=11, fontweight='bold')
 
-    # Draw lattice atoms
-    for i in range(12):
-        for j in range(4):
-            ax.add_patch(Circle((i, j), 0.2, facecolor=COLORS['void'],
-                               edgecolor='black', linewidth=0.5))
+    # Draw lattice atoms (the same 12 x 4 grid is reused for the ion cores)
+    I, J = np.meshgrid(np.arange(12), np.arange(4), indexing='ij')
+    lattice = np.column_stack([I.ravel(), J.ravel()])
+    ax.add_collection(EllipseCollection(
+        0.4, 0.4, 0, units='xy', offsets=lattice,
+        offset_transform=ax.transData, facecolors=COLORS['void'],
+        edgecolors='black', linewidths=0.5))
 
-    # Draw phonon wave packet traveling
+    # Draw phonon wave packet traveling: displaced atoms and their velocities
     packet_center = 5
     packet_width = 2
-    for i in range(12):
-        if abs(i - packet_center) < packet_width:
-            y_offset = 0.3 * np.exp(-0.5 * ((i - packet_center) / 0.8)**2) * np.sin(3 * i)
-            ax.add_patch(Circle((i, 2 + y_offset), 0.22,
-                               facecolor='orange', edgecolor='black', linewidth=1))
-            ax.annotate('', xy=(i + 0.3, 2 + y_offset), xytext=(i - 0.1, 2 + y_offset),
-                       arrowprops=dict(arrowstyle='->', color='orange', lw=1))
+    i = np.arange(12)
+    i = i[np.abs(i - packet_center) < packet_width]
+    y = 2 + 0.3 * np.exp(-0.5 * ((i - packet_center) / 0.8)**2) * np.sin(3 * i)
+    ax.add_collection(EllipseCollection(
+        0.44, 0.44, 0, units='xy', offsets=np.column_stack([i, y]),
+        offset_transform=ax.transData, facecolors='orange',
+        edgecolors='black', linewidths=1))
+    ax.quiver(i - 0.1, y, np.full(len(i), 0.4), np.zeros(len(i)), angles='xy',
+              scale_units='xy', scale=1, units='xy', width=0.03, headwidth=4,
+              headlength=4.5, headaxislength=4, color='orange')
 
     ax.text(5, 3.5, 'Phonon wave packet', fontsize=9, ha='center', color='orange')
     ax.text(5, -0.5, 'Carries vibrational energy from hot to cold',
@@ -94,24 +99,24 @@ def generate_heat_conduction():
     ax.axis('off')
     ax.set_title('Electron Heat Transport (Metals)', fontsize=11, fontweight='bold')
 
-    # Draw ion cores
-    for i in range(12):
-        for j in range(4):
-            ax.add_patch(Circle((i, j), 0.25, facecolor=COLORS['matter'],
-                               edgecolor='black', linewidth=1))
-            ax.text(i, j, '+', fontsize=8, ha='center', va='center', color='white')
+    # Draw ion cores, each marked with a white '+'
+    ax.add_collection(EllipseCollection(
+        0.5, 0.5, 0, units='xy', offsets=lattice,
+        offset_transform=ax.transData, facecolors=COLORS['matter'],
+        edgecolors='black', linewidths=1))
+    ax.plot(*lattice.T, '+', color='white', markersize=5.5, markeredgewidth=0.7)
 
     # Draw electrons moving from hot to cold
-    np.random.seed(42)
-    for _ in range(8):
-        x = np.random.uniform(1, 10)
-        y = np.random.uniform(0.5, 3.5)
-        # Drift velocity toward cold end
-        ax.add_patch(Circle((x, y), 0.12, facecolor=COLORS['antimatter'],
-                           edgecolor='black', linewidth=0.5))
-        ax.annotate('', xy=(x + 0.4, y + np.random.uniform(-0.1, 0.1)),
-                   xytext=(x + 0.15, y),
-                   arrowprops=dict(arrowstyle='->', color=COLORS['antimatter'], lw=1))
+    x = rng.uniform(1, 10, 8)
+    y = rng.uniform(0.5, 3.5, 8)
+    ax.add_collection(EllipseCollection(
+        0.24, 0.24, 0, units='xy', offsets=np.column_stack([x, y]),
+        offset_transform=ax.transData, facecolors=COLORS['antimatter'],
+        edgecolors='black', linewidths=0.5))
+    # Drift velocity toward cold end
+    ax.quiver(x + 0.15, y, np.full(8, 0.25), rng.uniform(-0.1, 0.1, 8), angles='xy',
+              scale_units='xy', scale=1, units='xy', width=0.03, headwidth=4,
+              headlength=4.5, headaxislength=4, color=COLORS['antimatter'])
 
     ax.text(5, -0.5, 'Fast electrons carry kinetic energy from hot region',
             fontsize=9, ha='center')
@@ -156,7 +161,9 @@ def generate_heat_conduction():
     fig.suptitle('Heat Conduction: Energy Transport via Flux Carriers',
                 fontsize=14, fontweight='bold')
 
-    plt.tight_layout(rect=[0, 0, 1, 0.95])
+    # Margins as measured from tight_layout(rect=[0, 0, 1, 0.95])
+    fig.subplots_adjust(left=0.011, right=0.989, bottom=0.061, top=0.901,
+                        wspace=0.136, hspace=-0.102)
     return fig
 
 
@@ -164,7 +171,7 @@ if __name__ == '__main__':
     fig = generate_heat_conduction()
     output_path = Path(__file__).parent.parent / 'ch03' / 'fig_3_21_heat_conduction.png'
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(output_path, dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
+    fig.savefig(output_path, dpi=150, facecolor='white', edgecolor='none',
+                pil_kwargs={'compress_level': 1, 'optimize': False})
     print(f"Saved: {output_path}")
     plt.close(fig)
@@ -6,8 +6,11 @@ from TRD perspective.
 """
 
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # figures are only saved, never shown
 import matplotlib.pyplot as plt
-from matplotlib.patches import Circle, FancyArrowPatch, Ellipse, Rectangle
+from matplotlib.collections import EllipseCollection, LineCollection
+from matplotlib.patches import Circle, Ellipse, Rectangle
 import sys
 from pathlib import Path
 
@@ -55,16 +58,16 @@ def generate_superconductivity():
     ax.axis('off')
     ax.set_title('Cooper Pair: Phonon-Mediated Attraction', fontsize=11, fontweight='bold')
 
-    # Draw lattice deformation
-    for i in range(-3, 4):
-        for j in range(-2, 3):
-            # Slight deformation near electron 1 position
-            dist1 = np.sqrt((i + 1.5)**2 + j**2)
-            offset = 0.15 / (1 + dist1) if dist1 > 0 else 0
-
-            ax.add_patch(Circle((i - offset * np.sign(i + 1.5), j), 0.15,
-                               facecolor=COLORS['matter'], edgecolor='black',
-                               linewidth=0.5, alpha=0.7))
+    # Draw lattice deformation: ions are pulled slightly toward electron 1
+    # (never at a lattice site, so the distance is always positive)
+    I, J = np.meshgrid(np.arange(-3, 4), np.arange(-2, 3), indexing='ij')
+    dist1 = np.hypot(I + 1.5, J)
+    offset = 0.15 / (1 + dist1)
+    ions = np.column_stack([(I - offset * np.sign(I + 1.5)).ravel(), J.ravel()])
+    ax.add_collection(EllipseCollection(
+        0.3, 0.3, 0, units='xy', offsets=ions, offset_transform=ax.transData,
+        facecolors=COLORS['matter'], edgecolors='black', linewidths=0.5,
+        alpha=0.7))
 
     # Electron 1
     ax.add_patch(Circle((-1.5, 0), 0.25, facecolor=COLORS['antimatter'],
@@ -105,27 +108,23 @@ def generate_superconductivity():
     ax.add_patch(rect)
     ax.text(0, 0, 'Superconductor\nB = 0 inside', fontsize=10, ha='center', va='center')
 
-    # External field lines bending around
+    # External field lines bending around, collected into one LineCollection
+    field_lines = []
     for y_start in np.linspace(-2.5, 2.5, 7):
         # Field line bends around superconductor
         if abs(y_start) < 1.3:
-            # Lines that would go through - bend around
-            x = np.linspace(-4, -2, 20)
-            y = np.full_like(x, y_start)
-            ax.plot(x, y, 'b-', linewidth=1)
-
-            # Bend around top or bottom
+            # Lines that would go through - bend around top or bottom
             theta = np.linspace(np.pi, 0 if y_start > 0 else 2*np.pi, 20)
             r = 1.5 + abs(y_start) * 0.3
             x_arc = r * np.cos(theta)
             y_arc = (1.5 if y_start > 0 else -1.5) + 0.5 * np.sin(theta) * np.sign(y_start)
-            ax.plot(x_arc, y_arc, 'b-', linewidth=1)
-
-            x = np.linspace(2, 4, 20)
-            ax.plot(x, np.full_like(x, y_start), 'b-', linewidth=1)
+            field_lines += [[(-4, y_start), (-2, y_start)],
+                            np.column_stack([x_arc, y_arc]),
+                            [(2, y_start), (4, y_start)]]
         else:
             # Lines that pass above/below
-            ax.plot([-4, 4], [y_start, y_start], 'b-', linewidth=1)
+            field_lines.append([(-4, y_start), (4, y_start)])
+    ax.add_collection(LineCollection(field_lines, colors='b', linewidths=1))
 
     ax.annotate('', xy=(3.5, 2), xytext=(3.5, 1),
                arrowprops=dict(arrowstyle='->', color='blue', lw=1.5))
@@ -179,7 +178,9 @@ def generate_superconductivity():
     fig.suptitle('Superconductivity: Coherent Flux Condensation',
                 fontsize=14, fontweight='bold')
 
-    plt.tight_layout(rect=[0, 0, 1, 0.95])
+    # Margins as measured from tight_layout(rect=[0, 0, 1, 0.95])
+    fig.subplots_adjust(left=0.047, right=0.989, bottom=0.015, top=0.881,
+                        wspace=0.026, hspace=0.198)
     return fig
 
 
@@ -187,7 +188,7 @@ if __name__ == '__main__':
     fig = generate_superconductivity()
     output_path = Path(__file__).parent.parent / 'ch03' / 'fig_3_22_superconductivity.png'
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(output_path, dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
+    fig.savefig(output_path, dpi=150, facecolor='white', edgecolor='none',
+                pil_kwargs={'compress_level': 1, 'optimize': False})
     print(f"Saved: {output_path}")
     plt.close(fig)
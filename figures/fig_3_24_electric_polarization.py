@@ -34,15 +34,14 @@ def generate_electric_polarization():
                            edgecolor='black', linewidth=2))
     ax.text(2.5, 5.3, 'No Field', fontsize=10, ha='center')
 
-    np.random.seed(42)
-    for _ in range(12):
-        x = np.random.uniform(0.5, 4.5)
-        y = np.random.uniform(0.5, 4.5)
-        angle = np.random.uniform(0, 360)
-
-        # Random dipole orientation
-        dx = 0.3 * np.cos(np.radians(angle))
-        dy = 0.3 * np.sin(np.radians(angle))
+    # Random dipole positions and orientations, drawn in bulk
+    rng = np.random.default_rng(42)
+    dipole_x = rng.uniform(0.5, 4.5, 12)
+    dipole_y = rng.uniform(0.5, 4.5, 12)
+    dipole_angle = np.radians(rng.uniform(0, 360, 12))
+    for x, y, angle in zip(dipole_x, dipole_y, dipole_angle):
+        dx = 0.3 * np.cos(angle)
+        dy = 0.3 * np.sin(angle)
 
         ax.add_patch(Circle((x - dx, y - dy), 0.15, facecolor=COLORS['antimatter'],
                            edgecolor='black', linewidth=0.5))
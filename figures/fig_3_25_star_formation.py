@@ -6,26 +6,80 @@ from TRD flux accumulation perspective.
 """
 
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # figures are only saved, never shown
 import matplotlib.pyplot as plt
-from matplotlib.patches import Circle, Wedge
-from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.patches import Circle
+from matplotlib.collections import EllipseCollection, LineCollection
+from matplotlib.colors import LinearSegmentedColormap, to_rgba
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.style import COLORS
 
+# Custom colormap for density
+_DENSITY_CMAP = LinearSegmentedColormap.from_list(
+    'density', ['#000033', '#003366', '#006699', '#3399CC',
+                '#66CCFF', '#FFFF99', '#FFCC00', '#FF6600', '#FF0000'])
+
+
+@lru_cache(maxsize=4)
+def _nested_disc_rgba(n, r_min, aspect, size):
+    """
+    Density gradient: n nested ellipses, each at alpha 0.3, composited
+    into one image.
+
+    The ellipses have semi-axes (r, aspect * r) for r from 3 down to
+    r_min, coloured by density and drawn largest first, as the panels
+    used to do with one patch each.
+
+    Parameters
+    ----------
+    n : int
+        Number of nested ellipses
+    r_min : float
+        Semi-major axis of the innermost ellipse
+    aspect : float
+        Ratio of minor to major semi-axis (1 for circles)
+    size : int
+        Pixels along the [-3, 3] x axis
+
+    Returns
+    -------
+    numpy.ndarray
+        RGBA image covering [-3, 3] x [-3 * aspect, 3 * aspect], read-only
+        since it is cached
+    """
+    ny = max(1, round(size * aspect))
+    xs = (np.arange(size) + 0.5) / size * 6 - 3
+    ys = ((np.arange(ny) + 0.5) / ny * 6 - 3) * aspect
+    x, y = np.meshgrid(xs, ys)
+    rho = np.hypot(x, y / aspect)
+
+    # Premultiplied "over" compositing, outermost ellipse first
+    rgb = np.zeros((ny, size, 3))
+    alpha = np.zeros((ny, size))
+    for r in np.linspace(3, r_min, n):
+        inside = rho < r
+        rgb[inside] = 0.7 * rgb[inside] + 0.3 * np.array(_DENSITY_CMAP(1 - r/3)[:3])
+        alpha[inside] = 0.7 * alpha[inside] + 0.3
+
+    rgba = np.zeros((ny, size, 4))
+    covered = alpha > 0
+    rgba[covered, :3] = rgb[covered] / alpha[covered, None]
+    rgba[..., 3] = alpha
+    rgba.flags.writeable = False
+    return rgba
+
 
 def generate_star_formation():
     """Generate the star formation visualization."""
-    fig, axes = plt.subplots(2, 3, figsize=(15, 10), dpi=150)
+    fig, axes = plt.subplots(2, 3, figsize=(13.97, 9.83), dpi=150)
     fig.patch.set_facecolor(COLORS['background'])
-
-    # Custom colormap for density
-    density_colors = ['#000033', '#003366', '#006699', '#3399CC',
-                     '#66CCFF', '#FFFF99', '#FFCC00', '#FF6600', '#FF0000']
-    density_cmap = LinearSegmentedColormap.from_list('density', density_colors)
+    rng = np.random.default_rng(42)
 
     titles = [
         '1. Molecular Cloud',
@@ -44,39 +98,40 @@ def generate_star_formation():
         ax.set_title(titles[idx], fontsize=11, fontweight='bold')
 
         if idx == 0:
-            # Molecular cloud - diffuse gas
-            np.random.seed(42)
-            for _ in range(200):
-                x = np.random.normal(0, 2)
-                y = np.random.normal(0, 2)
-                size = np.random.uniform(0.05, 0.15)
-                alpha = np.random.uniform(0.1, 0.4)
-                ax.add_patch(Circle((x, y), size, facecolor='gray', alpha=alpha))
+            # Molecular cloud - diffuse gas, 200 particles of random size
+            # and opacity drawn as one collection
+            cloud = rng.normal(0, 2, (200, 2))
+            sizes = 2 * rng.uniform(0.05, 0.15, 200)
+            cloud_colors = np.tile(to_rgba('gray'), (200, 1))
+            cloud_colors[:, 3] = rng.uniform(0.1, 0.4, 200)
+            ax.add_collection(EllipseCollection(
+                sizes, sizes, np.zeros(200), units='xy', offsets=cloud,
+                offset_transform=ax.transData, facecolors=cloud_colors,
+                edgecolors='none'))
 
             ax.text(0, -4.5, 'Diffuse gas and dust\n(~10-100 particles/cm^3)',
                    fontsize=8, ha='center')
 
         elif idx == 1:
-            # Fragmentation - multiple clumps
-            np.random.seed(123)
-            centers = [(-2, 1.5), (1.5, 2), (-1, -1.5), (2, -1)]
-            for cx, cy in centers:
-                for _ in range(50):
-                    x = np.random.normal(cx, 0.6)
-                    y = np.random.normal(cy, 0.6)
-                    r = np.sqrt((x - cx)**2 + (y - cy)**2)
-                    alpha = 0.5 * np.exp(-r / 0.8)
-                    ax.add_patch(Circle((x, y), 0.08, facecolor='blue', alpha=alpha))
+            # Fragmentation - multiple clumps of 50 particles each, fading
+            # with distance from the clump centre
+            centers = np.array([(-2, 1.5), (1.5, 2), (-1, -1.5), (2, -1)])
+            spread = rng.normal(0, 0.6, (len(centers), 50, 2))
+            dist = np.hypot(spread[..., 0], spread[..., 1]).ravel()
+            clump_colors = np.tile(to_rgba('blue'), (dist.size, 1))
+            clump_colors[:, 3] = 0.5 * np.exp(-dist / 0.8)
+            ax.add_collection(EllipseCollection(
+                0.16, 0.16, 0, units='xy',
+                offsets=(centers[:, None] + spread).reshape(-1, 2),
+                offset_transform=ax.transData, facecolors=clump_colors,
+                edgecolors='none'))
 
             ax.text(0, -4.5, 'Jeans instability\ncauses fragmentation',
                    fontsize=8, ha='center')
 
         elif idx == 2:
             # Protostellar core - dense central region
-            for r in np.linspace(3, 0.1, 30):
-                alpha = 0.1 + 0.5 * (1 - r/3)
-                color = density_cmap(1 - r/3)
-                ax.add_patch(Circle((0, 0), r, facecolor=color, alpha=0.3))
+            ax.imshow(_nested_disc_rgba(30, 0.1, 1, 400), extent=[-3, 3, -3, 3])
 
             # Infall arrows
             for angle in np.linspace(0, 2*np.pi, 8, endpoint=False):
@@ -91,11 +146,8 @@ def generate_star_formation():
         elif idx == 3:
             # Accretion disk
             # Disk (ellipse viewed at angle)
-            for r in np.linspace(3, 0.5, 15):
-                ellipse = plt.matplotlib.patches.Ellipse(
-                    (0, 0), 2*r, 0.6*r, facecolor=density_cmap(1 - r/3),
-                    alpha=0.3)
-                ax.add_patch(ellipse)
+            ax.imshow(_nested_disc_rgba(15, 0.5, 0.3, 400),
+                      extent=[-3, 3, -0.9, 0.9])
 
             # Central protostar
             ax.add_patch(Circle((0, 0), 0.4, facecolor='yellow',
@@ -117,11 +169,13 @@ def generate_star_formation():
             ax.add_patch(Circle((0, 0), 1, facecolor='orange',
                                edgecolor='red', linewidth=3))
 
-            # Irregular brightness symbols
-            for angle in np.linspace(0, 2*np.pi, 12, endpoint=False):
-                r = 1.5 + 0.3 * np.sin(5 * angle)
-                x, y = r * np.cos(angle), r * np.sin(angle)
-                ax.plot([0, x], [0, y], 'yellow', linewidth=1, alpha=0.5)
+            # Irregular brightness symbols, spokes of varying length
+            angles = np.linspace(0, 2*np.pi, 12, endpoint=False)
+            ends = (1.5 + 0.3 * np.sin(5 * angles))[:, None] * np.column_stack(
+                [np.cos(angles), np.sin(angles)])
+            spokes = np.stack([np.zeros_like(ends), ends], axis=1)
+            ax.add_collection(LineCollection(spokes, colors='yellow', linewidths=1,
+                                             alpha=0.5, capstyle='projecting'))
 
             # Remaining disk
             for r in np.linspace(3, 2, 5):
@@ -142,23 +196,27 @@ def generate_star_formation():
             ax.text(0, 0, 'H -> He', fontsize=9, ha='center', va='center')
 
             # Radiation
-            for angle in np.linspace(0, 2*np.pi, 16, endpoint=False):
-                x1, y1 = 2.2 * np.cos(angle), 2.2 * np.sin(angle)
-                x2, y2 = 3.5 * np.cos(angle), 3.5 * np.sin(angle)
-                ax.plot([x1, x2], [y1, y2], 'yellow', linewidth=2, alpha=0.7)
+            angles = np.linspace(0, 2*np.pi, 16, endpoint=False)
+            directions = np.column_stack([np.cos(angles), np.sin(angles)])
+            rays = np.stack([2.2 * directions, 3.5 * directions], axis=1)
+            ax.add_collection(LineCollection(rays, colors='yellow', linewidths=2,
+                                             alpha=0.7, capstyle='projecting'))
 
             ax.text(0, -4.5, 'Hydrostatic equilibrium\nfusion ignited',
                    fontsize=8, ha='center')
 
     fig.suptitle('Star Formation: From Cloud to Fusion',
-                fontsize=14, fontweight='bold', y=0.98)
+                fontsize=14, fontweight='bold', y=0.99)
 
-    fig.text(0.5, 0.02, 'TRD: Gravitational flux accumulation increases density '
+    fig.text(0.5, 0.019, 'TRD: Gravitational flux accumulation increases density '
             'until fusion threshold (KB) is reached.',
             fontsize=10, ha='center',
             bbox=dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor='gray'))
 
-    plt.tight_layout(rect=[0, 0.05, 1, 0.93])
+    # Margins as measured from the old bbox_inches='tight' crop of a 15 x 10
+    # figure; the equal-aspect panels fill their slots, so they keep their size
+    fig.subplots_adjust(left=0.007, right=0.993, bottom=0.059, top=0.873,
+                        wspace=0.280, hspace=0.069)
     return fig
 
 
@@ -166,7 +224,7 @@ if __name__ == '__main__':
     fig = generate_star_formation()
     output_path = Path(__file__).parent.parent / 'ch03' / 'fig_3_25_star_formation.png'
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(output_path, dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
+    fig.savefig(output_path, dpi=150, facecolor='white', edgecolor='none',
+                pil_kwargs={'compress_level': 1, 'optimize': False})
     print(f"Saved: {output_path}")
     plt.close(fig)
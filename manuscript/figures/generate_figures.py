@@ -10,8 +10,11 @@ Usage:
     python generate_figures.py --tier 2     # Generate only Tier 2 figures
     python generate_figures.py --tier 3     # Generate only Tier 3 figures
     python generate_figures.py --figure 1.1 # Generate specific figure
+    python generate_figures.py --figure 3.9 3.11 --jobs 0  # Several figures in parallel
     python generate_figures.py --list       # List all figures
     python generate_figures.py --dpi print  # Generate at print resolution (300 DPI)
+    python generate_figures.py --jobs 0     # Generate in parallel, one process per CPU
+    python generate_figures.py --changed    # Skip figures whose PNG is up to date
 
 Requirements:
     - matplotlib >= 3.7.0
@@ -19,14 +22,27 @@ Requirements:
 """
 
 import argparse
+import inspect
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 import importlib
+import importlib.util
 
 # Add this directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
+# Figures are only saved, never shown. Choosing Agg via the environment
+# (rather than matplotlib.use) keeps --list from importing matplotlib and
+# is inherited by --jobs worker processes.
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
 # Figure registry - maps figure IDs to their modules and output paths
+# Figures that lay out their own margins set 'crop': False and are saved
+# on their full canvas, matching their __main__ output; the rest are
+# cropped with bbox_inches='tight'.
 TIER1_FIGURES = {
     '1.1': {
         'module': 'individual.fig_01_lemniscate_alpha',
@@ -144,6 +160,7 @@ TIER2_FIGURES = {
         'output': 'ch01/fig_2_1_helmholtz.png',
         'description': 'Helmholtz Decomposition',
         'chapter': '1.5-the-flux-field.qmd',
+        'crop': False,
     },
     '2.2': {
         'module': 'individual.fig_2_02_discrete_continuous',
@@ -158,6 +175,7 @@ TIER2_FIGURES = {
         'output': 'ch01/fig_2_3_ontological_levels.png',
         'description': 'Ontological Levels',
         'chapter': '1.1-the-void.qmd',
+        'crop': False,
     },
     '2.4': {
         'module': 'individual.fig_2_04_force_gradients',
@@ -180,6 +198,7 @@ TIER2_FIGURES = {
         'output': 'ch02/fig_2_6_position_remainder.png',
         'description': 'Position Remainder',
         'chapter': '2.2-voxel-anatomy.qmd',
+        'crop': False,
     },
     '2.7': {
         'module': 'individual.fig_2_07_quantum_foam',
@@ -245,6 +264,7 @@ TIER2_FIGURES = {
         'output': 'ch04/fig_2_15_crystal_lattice.png',
         'description': 'Crystal Lattice',
         'chapter': '4.1-solid-state.qmd',
+        'crop': False,
     },
     '2.16': {
         'module': 'individual.fig_2_16_phase_transitions',
@@ -252,6 +272,7 @@ TIER2_FIGURES = {
         'output': 'ch04/fig_2_16_phase_transitions.png',
         'description': 'Phase Transitions',
         'chapter': '4.2-thermodynamics.qmd',
+        'crop': False,
     },
     '2.17': {
         'module': 'individual.fig_2_17_emergent_thermodynamics',
@@ -300,6 +321,7 @@ TIER3_FIGURES = {
         'output': 'ch01/fig_3_2_boundary_conditions.png',
         'description': 'Boundary Conditions',
         'chapter': '1.3-locality.qmd',
+        'crop': False,
     },
     '3.3': {
         'module': 'individual.fig_3_03_conservation_laws',
@@ -307,6 +329,7 @@ TIER3_FIGURES = {
         'output': 'ch01/fig_3_3_conservation_laws.png',
         'description': 'Conservation Laws',
         'chapter': '1.7-conservation.qmd',
+        'crop': False,
     },
     '3.4': {
         'module': 'individual.fig_3_04_update_order',
@@ -336,6 +359,7 @@ TIER3_FIGURES = {
         'output': 'ch02/fig_3_7_spin_states.png',
         'description': 'Spin States',
         'chapter': '2.3-the-particle-zoo.qmd',
+        'crop': False,
     },
     '3.8': {
         'module': 'individual.fig_3_08_color_charge',
@@ -350,6 +374,7 @@ TIER3_FIGURES = {
         'output': 'ch02/fig_3_9_weak_interaction.png',
         'description': 'Weak Interaction',
         'chapter': '2.5-weak-force.qmd',
+        'crop': False,
     },
     '3.10': {
         'module': 'individual.fig_3_10_pair_production',
@@ -364,6 +389,7 @@ TIER3_FIGURES = {
         'output': 'ch02/fig_3_11_annihilation_sequence.png',
         'description': 'Annihilation Sequence',
         'chapter': '2.4-quantum-phenomena.qmd',
+        'crop': False,
     },
     '3.12': {
         'module': 'individual.fig_3_12_virtual_lifetime',
@@ -371,6 +397,7 @@ TIER3_FIGURES = {
         'output': 'ch02/fig_3_12_virtual_lifetime.png',
         'description': 'Virtual Particle Lifetime',
         'chapter': '2.4-quantum-phenomena.qmd',
+        'crop': False,
     },
     # Atomic/Molecular (3.13-3.18)
     '3.13': {
@@ -386,6 +413,7 @@ TIER3_FIGURES = {
         'output': 'ch03/fig_3_14_periodic_table_trd.png',
         'description': 'Periodic Table (TRD)',
         'chapter': '3.2-atomic-structure.qmd',
+        'crop': False,
     },
     '3.15': {
         'module': 'individual.fig_3_15_metallic_bonding',
@@ -407,6 +435,7 @@ TIER3_FIGURES = {
         'output': 'ch03/fig_3_17_resonance.png',
         'description': 'Resonance Structures',
         'chapter': '3.3-chemical-bonds.qmd',
+        'crop': False,
     },
     '3.18': {
         'module': 'individual.fig_3_18_reaction_coordinate',
@@ -429,6 +458,7 @@ TIER3_FIGURES = {
         'output': 'ch03/fig_3_20_phonon_propagation.png',
         'description': 'Phonon Propagation',
         'chapter': '4.1-solid-state.qmd',
+        'crop': False,
     },
     '3.21': {
         'module': 'individual.fig_3_21_heat_conduction',
@@ -436,6 +466,7 @@ TIER3_FIGURES = {
         'output': 'ch03/fig_3_21_heat_conduction.png',
         'description': 'Heat Conduction',
         'chapter': '4.2-thermodynamics.qmd',
+        'crop': False,
     },
     '3.22': {
         'module': 'individual.fig_3_22_superconductivity',
@@ -443,6 +474,7 @@ TIER3_FIGURES = {
         'output': 'ch03/fig_3_22_superconductivity.png',
         'description': 'Superconductivity',
         'chapter': '4.3-quantum-materials.qmd',
+        'crop': False,
     },
     '3.23': {
         'module': 'individual.fig_3_23_magnetic_domains',
@@ -465,6 +497,7 @@ TIER3_FIGURES = {
         'output': 'ch03/fig_3_25_star_formation.png',
         'description': 'Star Formation',
         'chapter': '5.1-cosmic-structure.qmd',
+        'crop': False,
     },
     '3.26': {
         'module': 'individual.fig_3_26_gravitational_lensing',
@@ -472,6 +505,7 @@ TIER3_FIGURES = {
         'output': 'ch03/fig_3_26_gravitational_lensing.png',
         'description': 'Gravitational Lensing',
         'chapter': '5.1-cosmic-structure.qmd',
+        'crop': False,
     },
     '3.27': {
         'module': 'individual.fig_3_27_black_holes',
@@ -506,6 +540,9 @@ TIER3_FIGURES = {
 # Combined registry
 ALL_FIGURES = {**TIER1_FIGURES, **TIER2_FIGURES, **TIER3_FIGURES}
 
+# Shared style module; every figure depends on it
+STYLE_PATH = Path(__file__).parent / 'utils' / 'style.py'
+
 # Resolution settings
 DPI_SETTINGS = {
     'web': 150,
@@ -514,7 +551,63 @@ DPI_SETTINGS = {
 }
 
 
-def generate_figure(fig_id: str, output_dir: Path, dpi: str = 'web') -> bool:
+def is_up_to_date(config: dict, output_path: Path) -> bool:
+    """
+    Check whether a figure's PNG is newer than everything it is built from.
+
+    Parameters
+    ----------
+    config : dict
+        Registry entry for the figure
+    output_path : Path
+        Path of the saved PNG
+
+    Returns
+    -------
+    bool
+        True if the PNG exists and is newer than both the figure module
+        and ``utils/style.py``. False if the module cannot be found.
+    """
+    if not output_path.exists():
+        return False
+
+    # find_spec locates the source without importing it (and matplotlib).
+    # A module it cannot find is reported as stale, so the import in
+    # generate_figure fails for that figure alone instead of the batch.
+    try:
+        spec = importlib.util.find_spec(config['module'])
+    except ImportError:
+        spec = None
+    if spec is None or spec.origin is None:
+        return False
+    source = Path(spec.origin)
+    newest_input = max(source.stat().st_mtime, STYLE_PATH.stat().st_mtime)
+    return output_path.stat().st_mtime > newest_input
+
+
+@contextmanager
+def closing_new_figures(keep=None):
+    """
+    Close every pyplot figure opened inside the block, even on error.
+
+    Parameters
+    ----------
+    keep : matplotlib.figure.Figure, optional
+        Figure to leave open, e.g. the canvas shared across a batch
+    """
+    import matplotlib.pyplot as plt
+
+    before = set(plt.get_fignums())
+    try:
+        yield
+    finally:
+        for num in set(plt.get_fignums()) - before:
+            if keep is None or num != keep.number:
+                plt.close(num)
+
+
+def generate_figure(fig_id: str, output_dir: Path, dpi: str = 'web',
+                    shared_fig=None, changed_only: bool = False) -> bool:
     """
     Generate a single figure and save it.
 
@@ -525,7 +618,15 @@ def generate_figure(fig_id: str, output_dir: Path, dpi: str = 'web') -> bool:
     output_dir : Path
         Base directory for output
     dpi : str
-        Resolution setting ('web', 'print', 'preview')
+        Resolution setting ('web', 'print', 'preview'). The resolved value
+        is also passed to generators that accept a ``dpi`` argument.
+    shared_fig : matplotlib.figure.Figure, optional
+        Figure to reuse for generators that accept a ``fig`` argument.
+        It is left open after saving so the next figure can reuse it.
+    changed_only : bool
+        Skip the figure if its PNG is newer than its module and the
+        shared style. The resolution is not tracked, so changing ``dpi``
+        needs a full rebuild.
 
     Returns
     -------
@@ -539,34 +640,43 @@ def generate_figure(fig_id: str, output_dir: Path, dpi: str = 'web') -> bool:
 
     config = ALL_FIGURES[fig_id]
     resolution = DPI_SETTINGS.get(dpi, 150)
+    output_path = output_dir / config['output']
+
+    if changed_only and is_up_to_date(config, output_path):
+        print(f"  [SKIP] Up to date: {output_path}")
+        return True
 
     print(f"Generating Figure {fig_id}: {config['description']}...")
 
     try:
-        # Import the module and get the function
-        module = importlib.import_module(config['module'])
-        func = getattr(module, config['function'])
-
-        # Generate the figure
-        fig = func()
-
-        # Create output path
-        output_path = output_dir / config['output']
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Save the figure
-        fig.savefig(
-            output_path,
-            dpi=resolution,
-            bbox_inches='tight',
-            facecolor='white',
-            edgecolor='none',
-            pad_inches=0.1
-        )
-
-        # Close to free memory
-        import matplotlib.pyplot as plt
-        plt.close(fig)
+        # Figures left open by a failed generator are closed as well
+        with closing_new_figures(keep=shared_fig):
+            # Import the module and get the function
+            module = importlib.import_module(config['module'])
+            func = getattr(module, config['function'])
+
+            # Generate the figure, passing the save resolution and reusing
+            # the shared canvas where the generator supports them
+            params = inspect.signature(func).parameters
+            kwargs = {}
+            if 'dpi' in params:
+                kwargs['dpi'] = resolution
+            if shared_fig is not None and 'fig' in params:
+                kwargs['fig'] = shared_fig
+            fig = func(**kwargs)
+
+            # Create output directory
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Save the figure
+            crop = {'bbox_inches': 'tight', 'pad_inches': 0.1}
+            fig.savefig(
+                output_path,
+                dpi=resolution,
+                facecolor='white',
+                edgecolor='none',
+                **(crop if config.get('crop', True) else {})
+            )
 
         print(f"  [OK] Saved: {output_path}")
         return True
@@ -643,13 +753,17 @@ Examples:
   python generate_figures.py --tier 3     # Generate only Tier 3 figures
   python generate_figures.py --figure 1.1 # Generate specific figure
   python generate_figures.py --figure 3.5 # Generate specific Tier 3 figure
+  python generate_figures.py --figure 3.9 3.11 3.12 --jobs 0
+                                          # Several figures in parallel
   python generate_figures.py --list       # List all figures
   python generate_figures.py --dpi print  # Print quality (300 DPI)
+  python generate_figures.py --jobs 4     # Use 4 worker processes
+  python generate_figures.py --changed    # Only rebuild out-of-date figures
         """
     )
 
-    parser.add_argument('--figure', '-f', type=str,
-                        help='Generate specific figure (e.g., 1.1, 2.5, or 3.10)')
+    parser.add_argument('--figure', '-f', type=str, nargs='+',
+                        help='Generate specific figure(s) (e.g., 1.1, 2.5, or 3.10)')
     parser.add_argument('--tier', '-t', type=int, choices=[1, 2, 3],
                         help='Generate only specific tier (1, 2, or 3)')
     parser.add_argument('--list', '-l', action='store_true',
@@ -659,6 +773,12 @@ Examples:
                         help='Resolution: web=150, print=300, preview=72')
     parser.add_argument('--output', '-o', type=str, default=None,
                         help='Output directory (default: same as script)')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Worker processes for batch generation '
+                             '(default: 1; 0 = one per CPU)')
+    parser.add_argument('--changed', '-c', action='store_true',
+                        help='Skip figures whose PNG is newer than their '
+                             'module and utils/style.py')
 
     args = parser.parse_args()
 
@@ -674,12 +794,16 @@ Examples:
         return 0
 
     # Handle --figure
-    if args.figure:
-        success = generate_figure(args.figure, output_dir, args.dpi)
+    if args.figure and len(args.figure) == 1:
+        success = generate_figure(args.figure[0], output_dir, args.dpi,
+                                  changed_only=args.changed)
         return 0 if success else 1
 
     # Determine which figures to generate
-    if args.tier == 1:
+    if args.figure:
+        figures_to_generate = args.figure
+        tier_label = "selected"
+    elif args.tier == 1:
         figures_to_generate = TIER1_FIGURES
         tier_label = "Tier 1"
     elif args.tier == 2:
@@ -698,14 +822,27 @@ Examples:
     print(f"Resolution: {args.dpi} ({DPI_SETTINGS[args.dpi]} DPI)")
     print("=" * 70)
 
-    success_count = 0
-    fail_count = 0
-
-    for fig_id in figures_to_generate:
-        if generate_figure(fig_id, output_dir, args.dpi):
-            success_count += 1
-        else:
-            fail_count += 1
+    # Each figure is independent, so batches can be spread across processes
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    fig_ids = list(figures_to_generate)
+
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(generate_figure, fig_ids,
+                                    [output_dir] * len(fig_ids),
+                                    [args.dpi] * len(fig_ids),
+                                    [None] * len(fig_ids),
+                                    [args.changed] * len(fig_ids)))
+    else:
+        import matplotlib.pyplot as plt
+        shared_fig = plt.figure()
+        results = [generate_figure(fig_id, output_dir, args.dpi, shared_fig,
+                                   args.changed)
+                   for fig_id in fig_ids]
+        plt.close(shared_fig)
+
+    success_count = sum(results)
+    fail_count = len(results) - success_count
 
     print("=" * 70)
     print(f"Complete! {success_count} succeeded, {fail_count} failed.")
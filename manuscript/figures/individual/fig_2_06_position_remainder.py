@@ -12,28 +12,40 @@ When |remainder| >= 1, the particle jumps to an adjacent voxel.
 """
 
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # figures are only saved, never shown
 import matplotlib.pyplot as plt
 from matplotlib.patches import FancyBboxPatch, FancyArrowPatch, Rectangle, Circle
+from matplotlib.colors import ListedColormap
 import matplotlib.patches as mpatches
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.style import COLORS, apply_trd_style
+from utils.style import BBOX_STYLES, COLORS, apply_trd_style, prepare_figure
 
 
-def generate_position_remainder():
+def generate_position_remainder(fig=None):
     """
     Generate the position remainder visualization.
 
     Shows:
     1. Top: Time series of remainder accumulation
     2. Bottom: Lattice view of particle jumping
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure, optional
+        Existing figure to clear and draw into (for batch builds).
     """
-    fig, (ax_top, ax_bottom) = plt.subplots(2, 1, figsize=(12, 10), dpi=150,
-                                             height_ratios=[1, 1.2])
-    fig.patch.set_facecolor(COLORS['background'])
+    c_matter = COLORS['matter']
+    c_highlight = COLORS['highlight']
+    c_accent = COLORS['accent1']
+
+    fig, (ax_top, ax_bottom) = prepare_figure(fig, 2, 1, figsize=(12, 10),
+                                              height_ratios=[1, 1.2],
+                                              facecolor=COLORS['background'])
 
     # =========================================================================
     # Top: Remainder accumulation over time
@@ -41,42 +53,31 @@ def generate_position_remainder():
     ticks = np.arange(0, 25)
     velocity = 0.15  # Fractional velocity per tick
 
-    remainder = np.zeros(len(ticks))
-    position = np.zeros(len(ticks))
-
-    current_pos = 0
-    current_rem = 0
-
-    for i, t in enumerate(ticks):
-        current_rem += velocity
-        if current_rem >= 1.0:
-            current_pos += 1
-            current_rem -= 1.0
-        elif current_rem <= -1.0:
-            current_pos -= 1
-            current_rem += 1.0
-
-        remainder[i] = current_rem
-        position[i] = current_pos
+    # Cumulative displacement after each tick (closed form of the running
+    # sum for constant velocity). Truncating toward zero splits it into the
+    # integer voxel position and the signed remainder, matching the
+    # r >= 1 / r <= -1 update rule in both directions.
+    displacement = velocity * (ticks + 1)
+    position = np.trunc(displacement)
+    remainder = displacement - position
 
     # Plot remainder
-    ax_top.fill_between(ticks, 0, remainder, alpha=0.3, color=COLORS['highlight'])
-    ax_top.plot(ticks, remainder, 'o-', color=COLORS['highlight'],
+    ax_top.fill_between(ticks, 0, remainder, alpha=0.3, color=c_highlight)
+    ax_top.plot(ticks, remainder, 'o-', color=c_highlight,
                 linewidth=2, markersize=6)
 
     # Mark threshold crossings
-    ax_top.axhline(y=1.0, color=COLORS['matter'], linestyle='--', linewidth=2,
+    ax_top.axhline(y=1.0, color=c_matter, linestyle='--', linewidth=2,
                    label='Jump threshold (+1)')
     ax_top.axhline(y=0, color='gray', linestyle='-', linewidth=1, alpha=0.5)
 
     # Mark jump events
-    jump_ticks = [6, 13, 20]  # Approximate tick numbers where jumps occur
+    jump_ticks = ticks[1:][np.diff(position) != 0]
+    ax_top.vlines(jump_ticks, -0.2, 1.2, colors=c_matter,
+                  linestyles=':', linewidth=2, alpha=0.7)
     for jt in jump_ticks:
-        if jt < len(ticks):
-            ax_top.axvline(x=jt, color=COLORS['matter'], linestyle=':',
-                          linewidth=2, alpha=0.7)
-            ax_top.annotate('JUMP!', xy=(jt, 0.9), fontsize=9,
-                           color=COLORS['matter'], fontweight='bold')
+        ax_top.annotate('JUMP!', xy=(jt, 0.9), fontsize=9,
+                        color=c_matter, fontweight='bold')
 
     ax_top.set_xlim(-1, 25)
     ax_top.set_ylim(-0.2, 1.2)
@@ -93,17 +94,31 @@ def generate_position_remainder():
     ax_bottom.set_xlim(-0.5, 6.5)
     ax_bottom.set_ylim(-0.5, 4)
     ax_bottom.set_aspect('equal')
-    ax_bottom.axis('off')
-
-    # Draw lattice grid
-    for x in range(7):
-        for y_offset in [0.5, 2.5]:
-            rect = Rectangle((x - 0.4, y_offset - 0.4), 0.8, 0.8,
-                             facecolor='#f0f0f0', edgecolor='gray',
-                             linewidth=1)
-            ax_bottom.add_patch(rect)
-            ax_bottom.text(x, y_offset - 0.55, str(x), fontsize=9,
-                          ha='center', color='gray')
+    ax_bottom.set_yticks([])
+    for spine in ax_bottom.spines.values():
+        spine.set_visible(False)
+
+    # Draw lattice grid as a single raster: cells are the points within 0.4
+    # (Chebyshev) of a site at (x, 0.5) or (x, 2.5); a thin outer band of
+    # each cell is the edge and everything else is masked out.
+    res = 200  # raster pixels per lattice unit
+    edge = 0.015
+    gx = np.arange(-0.5, 6.5, 1 / res) + 0.5 / res
+    gy = np.arange(0.0, 3.0, 1 / res) + 0.5 / res
+    dist = np.maximum(np.abs(gx - np.round(gx))[np.newaxis, :],
+                      np.abs(gy - 0.5 - 2 * np.round((gy - 0.5) / 2))[:, np.newaxis])
+    lattice = np.ma.masked_where(dist > 0.4, dist > 0.4 - edge)
+    ax_bottom.imshow(lattice, extent=[-0.5, 6.5, 0, 3], origin='lower',
+                     cmap=ListedColormap(['#f0f0f0', 'gray']), vmin=0, vmax=1,
+                     interpolation='nearest')
+
+    # Position labels: the x tick labels serve the t=0 row (bottom axis moved
+    # up to the cells) and the t=7 row (top axis moved down to the cells)
+    ax_bottom.set_xticks(range(7))
+    ax_bottom.spines['bottom'].set_position(('data', 0.08))
+    ax_bottom.spines['top'].set_position(('data', 1.85))
+    ax_bottom.tick_params(axis='x', length=0, pad=2, labelsize=9,
+                          labelcolor='gray', labeltop=True)
 
     # Time labels
     ax_bottom.text(-0.5, 0.5, 't=0', fontsize=10, ha='right', va='center')
@@ -111,30 +126,30 @@ def generate_position_remainder():
 
     # Show particle at different states
     # t=0: particle at position 0 with remainder 0
-    circle0 = Circle((0, 0.5), 0.25, facecolor=COLORS['matter'],
+    circle0 = Circle((0, 0.5), 0.25, facecolor=c_matter,
                      edgecolor='black', linewidth=2)
     ax_bottom.add_patch(circle0)
     ax_bottom.text(0, 0.9, 'r=0.0', fontsize=8, ha='center')
 
     # t=7: particle jumped to position 1, remainder reset
-    circle7 = Circle((1, 2.5), 0.25, facecolor=COLORS['matter'],
+    circle7 = Circle((1, 2.5), 0.25, facecolor=c_matter,
                      edgecolor='black', linewidth=2)
     ax_bottom.add_patch(circle7)
     ax_bottom.text(1, 2.9, 'r=0.05', fontsize=8, ha='center')
 
     # Show the jump arrow
     ax_bottom.annotate('', xy=(1, 2.0), xytext=(0, 1.0),
-                      arrowprops=dict(arrowstyle='->', color=COLORS['accent1'],
+                      arrowprops=dict(arrowstyle='->', color=c_accent,
                                      lw=3, connectionstyle='arc3,rad=0.2'))
     ax_bottom.text(0.5, 1.5, 'Jump when\nr ≥ 1.0', fontsize=10, ha='center',
-                  color=COLORS['accent1'], fontweight='bold')
+                  color=c_accent, fontweight='bold')
 
     # Remainder indicator (conceptual bar)
     bar_x = 3.5
     ax_bottom.add_patch(Rectangle((bar_x, 0.1), 0.3, 0.8,
                                    facecolor='#e0e0e0', edgecolor='gray'))
     ax_bottom.add_patch(Rectangle((bar_x, 0.1), 0.3, 0.75 * 0.8,
-                                   facecolor=COLORS['highlight'], edgecolor='none'))
+                                   facecolor=c_highlight, edgecolor='none'))
     ax_bottom.text(bar_x + 0.15, 0.95, 'r=0.75', fontsize=8, ha='center')
     ax_bottom.text(bar_x + 0.15, 0.0, 'Remainder', fontsize=8, ha='center')
 
@@ -164,10 +179,11 @@ def generate_position_remainder():
         "This bridges continuous velocity with discrete lattice structure."
     )
     fig.text(0.5, 0.02, explanation, ha='center', fontsize=10,
-             bbox=dict(boxstyle='round,pad=0.5', facecolor='white',
-                      edgecolor='gray', alpha=0.9))
+             bbox=BBOX_STYLES['caption'])
 
-    plt.tight_layout(rect=[0, 0.05, 1, 0.95])
+    # Margins as measured from tight_layout(rect=[0, 0.05, 1, 0.95])
+    fig.subplots_adjust(left=0.064, right=0.981, bottom=0.065, top=0.869,
+                        hspace=0.242)
 
     return fig
 
@@ -175,7 +191,7 @@ def generate_position_remainder():
 if __name__ == '__main__':
     fig = generate_position_remainder()
     output_path = Path(__file__).parent.parent / 'ch02' / 'fig_2_6_position_remainder.png'
-    fig.savefig(output_path, dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
+    fig.savefig(output_path, dpi=150, facecolor='white', edgecolor='none',
+                pil_kwargs={'compress_level': 1, 'optimize': False})
     print(f"Saved: {output_path}")
     plt.close(fig)
@@ -10,6 +10,8 @@ their common origin.
 
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import EllipseCollection
+from matplotlib.colors import to_rgba
 from matplotlib.patches import Circle, FancyArrowPatch, Wedge, Rectangle
 import matplotlib.patches as mpatches
 import sys
@@ -29,7 +31,7 @@ def generate_entanglement_origin():
     2. Middle: Separation while maintaining correlation
     3. Bottom: Correlation preserved at measurement
     """
-    fig = plt.figure(figsize=(14, 12), dpi=150)
+    fig = plt.figure(figsize=(14, 12))
     fig.patch.set_facecolor(COLORS['background'])
 
     # Create custom grid
@@ -57,9 +59,11 @@ def generate_entanglement_origin():
 
     # Draw flux concentration
     theta = np.linspace(0, 2*np.pi, 100)
+    cos_t = np.cos(theta)
+    sin_t = np.sin(theta)
     for r in [0.3, 0.5, 0.7, 0.9]:
         alpha = 0.6 - 0.5 * r
-        ax_creation.plot(1.5 + r * np.cos(theta), 1.8 + r * np.sin(theta),
+        ax_creation.plot(1.5 + r * cos_t, 1.8 + r * sin_t,
                         color=COLORS['highlight'], linewidth=2, alpha=alpha)
 
     ax_creation.text(1.5, 0.5, 'density > KB', fontsize=9, ha='center',
@@ -87,7 +91,7 @@ def generate_entanglement_origin():
                      color='white', fontweight='bold')
 
     # Wavy line connecting them (entanglement)
-    x_wave = np.linspace(4.85, 5.15, 50)
+    x_wave = np.linspace(4.85, 5.15, 12)
     y_wave = 1.8 + 0.1 * np.sin(20 * (x_wave - 4.85))
     ax_creation.plot(x_wave, y_wave, color='purple', linewidth=2, linestyle='-')
 
@@ -135,17 +139,23 @@ def generate_entanglement_origin():
     ax_separation.set_title('Spatial Separation', fontsize=12, fontweight='bold')
 
     # Show particles moving apart
-    positions = [(1, 3), (3, 3), (5, 3), (7, 3), (9, 3)]
-    for i, (x, _) in enumerate(positions):
-        alpha = 0.2 + 0.2 * i
-        # Left particle (moving left)
-        ax_separation.add_patch(Circle((5 - 0.8*i, 3), 0.25,
-                                       facecolor=COLORS['matter'],
-                                       edgecolor='black', alpha=alpha))
-        # Right particle (moving right)
-        ax_separation.add_patch(Circle((5 + 0.8*i, 3), 0.25,
-                                       facecolor=COLORS['antimatter'],
-                                       edgecolor='black', alpha=alpha))
+    # Left particle moves left, right particle moves right, fading in over
+    # five steps. Pairs are interleaved to keep the original draw order.
+    step = np.repeat(np.arange(5), 2)
+    side = np.tile([-1, 1], 5)
+    offsets = np.column_stack([5 + side * 0.8 * step, np.full(step.size, 3)])
+    alpha = 0.2 + 0.2 * step
+
+    facecolors = np.array([to_rgba(COLORS['matter']),
+                           to_rgba(COLORS['antimatter'])] * 5)
+    edgecolors = np.tile(to_rgba('black'), (step.size, 1))
+    facecolors[:, 3] = alpha
+    edgecolors[:, 3] = alpha
+
+    ax_separation.add_collection(EllipseCollection(
+        0.5, 0.5, 0, units='xy', offsets=offsets,
+        offset_transform=ax_separation.transData,
+        facecolors=facecolors, edgecolors=edgecolors))
 
     # Dashed line showing they came from same origin
     ax_separation.plot([1.8, 8.2], [3, 3], 'k--', linewidth=1, alpha=0.5)
@@ -182,15 +192,17 @@ def generate_entanglement_origin():
         ('UUID', 'shared', 'shared'),
     ]
 
-    for i, (prop, val_a, val_b) in enumerate(rows):
-        y = 4.3 - i * 0.9
+    row_ys = 4.3 - 0.9 * np.arange(len(rows))
+    for y, (prop, val_a, val_b) in zip(row_ys, rows):
         ax_properties.text(5, y, prop, fontsize=10, ha='center')
         ax_properties.text(2, y, val_a, fontsize=10, ha='center',
                           color=COLORS['matter'])
         ax_properties.text(8, y, val_b, fontsize=10, ha='center',
                           color=COLORS['antimatter'])
-        ax_properties.axhline(y=y-0.4, xmin=0.1, xmax=0.9, color='gray',
-                             linewidth=0.5, alpha=0.5)
+
+    # Row separators, drawn as one LineCollection
+    ax_properties.hlines(row_ys - 0.4, 1, 9, colors='gray',
+                         linewidth=0.5, alpha=0.5)
 
     ax_properties.text(5, 0.5, 'Conservation laws enforced\nat creation time',
                        fontsize=9, ha='center', style='italic')
@@ -258,8 +270,6 @@ def generate_entanglement_origin():
     fig.suptitle('Entanglement in TRD: Correlation from Common Origin',
                 fontsize=16, fontweight='bold', y=0.99)
 
-    plt.tight_layout(rect=[0, 0, 1, 0.97])
-
     return fig
 
 
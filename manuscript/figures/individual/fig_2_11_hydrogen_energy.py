@@ -27,7 +27,7 @@ def generate_hydrogen_energy():
     1. Left: Energy level diagram
     2. Right: Radial wavefunctions (flux patterns)
     """
-    fig, (ax_levels, ax_waves) = plt.subplots(1, 2, figsize=(14, 9), dpi=150)
+    fig, (ax_levels, ax_waves) = plt.subplots(1, 2, figsize=(14, 9))
     fig.patch.set_facecolor(COLORS['background'])
 
     # =========================================================================
@@ -45,19 +45,17 @@ def generate_hydrogen_energy():
         5: -0.54,
     }
 
-    # Draw energy levels
+    # Draw energy levels (all level lines in one LineCollection)
+    ax_levels.hlines(list(levels.values()), 1, 9, colors='black', linewidth=2)
     for n, E in levels.items():
-        # Level line
-        ax_levels.hlines(E, 1, 9, colors='black', linewidth=2)
         # Label
         ax_levels.text(0.5, E, f'n={n}', fontsize=11, va='center', ha='right')
         ax_levels.text(9.5, E, f'{E:.2f} eV', fontsize=10, va='center', ha='left')
 
-        # Sublevel degeneracy indication
-        if n > 1:
-            for l in range(n):
-                x_pos = 2 + l * 1.5
-                ax_levels.plot(x_pos, E, 'o', markersize=6, color=COLORS['highlight'])
+    # Sublevel degeneracy indication: one marker per l for n > 1
+    sublevels = [(2 + l * 1.5, E) for n, E in levels.items() if n > 1
+                 for l in range(n)]
+    ax_levels.plot(*zip(*sublevels), 'o', markersize=6, color=COLORS['highlight'])
 
     # Draw some transitions
     transitions = [
@@ -78,7 +76,7 @@ def generate_hydrogen_energy():
 
         # Wavy line (photon emission)
         y_mid = (E_upper + E_lower) / 2
-        t = np.linspace(0, 1, 30)
+        t = np.linspace(0, 1, 20)
         x_wave = x_pos + 0.3 + 0.15 * np.sin(10 * t)
         y_wave = E_upper + (E_lower - E_upper) * t
         ax_levels.plot(x_wave, y_wave, color=color, linewidth=1.5)
@@ -108,36 +106,32 @@ def generate_hydrogen_energy():
     # =========================================================================
     r = np.linspace(0, 25, 500)
 
-    # Simplified radial wavefunctions (proportional to actual)
-    def R_1s(r):
-        a0 = 1  # Bohr radius
-        return 2 * np.exp(-r / a0)
+    # Simplified radial wavefunctions (proportional to actual), in units of
+    # the Bohr radius. 2s and 2p share exp(-r/2), so only three exponentials
+    # are evaluated.
+    e1 = np.exp(-r)
+    e2 = np.exp(-r / 2)
+    e3 = np.exp(-r / 3)
 
-    def R_2s(r):
-        a0 = 1
-        return (1/np.sqrt(8)) * (2 - r/a0) * np.exp(-r / (2*a0))
+    wfs = np.empty((4, r.size))
+    wfs[0] = 2 * e1                                   # R_1s
+    wfs[1] = (2 - r) * e2 / np.sqrt(8)                # R_2s
+    wfs[2] = r * e2 / np.sqrt(24)                     # R_2p
+    wfs[3] = (2/81) * (27 - 18*r + 2*r*r) * e3        # R_3s
 
-    def R_2p(r):
-        a0 = 1
-        return (1/np.sqrt(24)) * (r/a0) * np.exp(-r / (2*a0))
-
-    def R_3s(r):
-        a0 = 1
-        return (2/81) * (27 - 18*r/a0 + 2*(r/a0)**2) * np.exp(-r / (3*a0))
+    # |R|^2 * r^2 (radial probability density), each normalized to its peak
+    prob = (wfs * r)**2
+    prob /= prob.max(axis=1, keepdims=True)
 
     wavefunctions = [
-        (R_1s, '1s (n=1, l=0)', COLORS['matter']),
-        (R_2s, '2s (n=2, l=0)', COLORS['antimatter']),
-        (R_2p, '2p (n=2, l=1)', COLORS['highlight']),
-        (R_3s, '3s (n=3, l=0)', COLORS['accent1']),
+        ('1s (n=1, l=0)', COLORS['matter']),
+        ('2s (n=2, l=0)', COLORS['antimatter']),
+        ('2p (n=2, l=1)', COLORS['highlight']),
+        ('3s (n=3, l=0)', COLORS['accent1']),
     ]
 
-    for wf, label, color in wavefunctions:
-        y = wf(r)
-        # Plot |R|^2 * r^2 (radial probability density)
-        prob = y**2 * r**2
-        prob = prob / np.max(prob)  # Normalize
-        ax_waves.plot(r, prob, color=color, linewidth=2, label=label)
+    for density, (label, color) in zip(prob, wavefunctions):
+        ax_waves.plot(r, density, color=color, linewidth=2, label=label)
 
     ax_waves.set_xlabel('Radius (Bohr radii)', fontsize=12)
     ax_waves.set_ylabel('Radial Probability Density', fontsize=12)
@@ -170,7 +164,9 @@ def generate_hydrogen_energy():
              bbox=dict(boxstyle='round,pad=0.5', facecolor='white',
                       edgecolor='gray', alpha=0.9))
 
-    plt.tight_layout(rect=[0, 0.06, 1, 0.95])
+    # Margins as measured from tight_layout(rect=[0, 0.06, 1, 0.95])
+    fig.subplots_adjust(left=0.054, right=0.983, bottom=0.128, top=0.834,
+                        wspace=0.188)
 
     return fig
 
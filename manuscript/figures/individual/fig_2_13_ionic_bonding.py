@@ -7,6 +7,8 @@ oppositely charged ions that attract via Coulomb flux interaction.
 
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import EllipseCollection
+from matplotlib.colors import to_rgba
 from matplotlib.patches import Circle, FancyArrowPatch, Rectangle
 import matplotlib.patches as mpatches
 import sys
@@ -26,7 +28,7 @@ def generate_ionic_bonding():
     2. Middle: Electron transfer
     3. Bottom: Ion pair and lattice
     """
-    fig, axes = plt.subplots(3, 1, figsize=(12, 12), dpi=150)
+    fig, axes = plt.subplots(3, 1, figsize=(12, 12))
     fig.patch.set_facecolor(COLORS['background'])
 
     ax_neutral, ax_transfer, ax_ionic = axes
@@ -50,12 +52,6 @@ def generate_ionic_bonding():
     ax_neutral.text(na_x, 0, 'Na', fontsize=10, ha='center', va='center',
                     color='white', fontweight='bold')
 
-    # Inner shells (full)
-    for r in [0.8, 1.3]:
-        shell = Circle((na_x, 0), r, facecolor='none',
-                       edgecolor=COLORS['antimatter'], linewidth=1.5, linestyle='--')
-        ax_neutral.add_patch(shell)
-
     # Outer shell with 1 electron
     outer = Circle((na_x, 0), 1.8, facecolor='none',
                    edgecolor=COLORS['antimatter'], linewidth=2)
@@ -75,24 +71,30 @@ def generate_ionic_bonding():
     ax_neutral.text(cl_x, 0, 'Cl', fontsize=10, ha='center', va='center',
                     color='white', fontweight='bold')
 
-    # Inner shells
-    for r in [0.8, 1.3]:
-        shell = Circle((cl_x, 0), r, facecolor='none',
-                       edgecolor=COLORS['antimatter'], linewidth=1.5, linestyle='--')
-        ax_neutral.add_patch(shell)
+    # Full inner shells of both atoms, sharing one unit-circle path
+    shell_r = np.array([0.8, 1.3, 0.8, 1.3])
+    shells = EllipseCollection(2 * shell_r, 2 * shell_r, 0, units='xy',
+                               offsets=[(na_x, 0), (na_x, 0), (cl_x, 0), (cl_x, 0)],
+                               offset_transform=ax_neutral.transData,
+                               facecolors='none', edgecolors=COLORS['antimatter'],
+                               linewidths=1.5, linestyles='--')
+    ax_neutral.add_collection(shells)
 
     # Outer shell with 7 electrons (one spot empty)
     outer_cl = Circle((cl_x, 0), 1.8, facecolor='none',
                       edgecolor=COLORS['antimatter'], linewidth=2)
     ax_neutral.add_patch(outer_cl)
 
-    for i, angle in enumerate(np.linspace(0, 2*np.pi, 8, endpoint=False)):
-        if i < 7:  # 7 electrons
-            x = cl_x + 1.8 * np.cos(angle)
-            y = 1.8 * np.sin(angle)
-            e = Circle((x, y), 0.12, facecolor=COLORS['antimatter'],
-                       edgecolor='black', linewidth=1)
-            ax_neutral.add_patch(e)
+    # 7 electrons on the 8-slot ring, drawn as one collection
+    angles = np.linspace(0, 2*np.pi, 8, endpoint=False)[:7]
+    electron_xy = np.column_stack([cl_x + 1.8 * np.cos(angles),
+                                   1.8 * np.sin(angles)])
+    electrons = EllipseCollection(0.24, 0.24, 0, units='xy',
+                                  offsets=electron_xy,
+                                  offset_transform=ax_neutral.transData,
+                                  facecolors=COLORS['antimatter'],
+                                  edgecolors='black', linewidths=1)
+    ax_neutral.add_collection(electrons)
 
     ax_neutral.text(cl_x, -2.5, 'Cl: 7 valence e-\n(wants 1 more)',
                     fontsize=9, ha='center')
@@ -191,20 +193,21 @@ def generate_ionic_bonding():
     lattice_y = -1
     spacing = 1.2
 
-    for i in range(5):
-        for j in range(2):
-            x = -2.4 + i * spacing
-            y = lattice_y + j * spacing
-
-            if (i + j) % 2 == 0:
-                # Na+
-                ion = Circle((x, y), 0.3, facecolor=COLORS['matter'],
-                            edgecolor='black', linewidth=1)
-            else:
-                # Cl-
-                ion = Circle((x, y), 0.35, facecolor=COLORS['accent1'],
-                            edgecolor='black', linewidth=1)
-            ax_ionic.add_patch(ion)
+    # All ten ions go into one collection; Na+ sits where (i + j) is even
+    I, J = np.meshgrid(np.arange(5), np.arange(2), indexing='ij')
+    offsets = np.column_stack([(-2.4 + I * spacing).ravel(),
+                               (lattice_y + J * spacing).ravel()])
+    is_na = ((I + J) % 2 == 0).ravel()
+
+    diameters = np.where(is_na, 0.6, 0.7)
+    ions = EllipseCollection(diameters, diameters, np.zeros(len(offsets)),
+                             units='xy', offsets=offsets,
+                             offset_transform=ax_ionic.transData,
+                             facecolors=np.where(is_na[:, None],
+                                                 to_rgba(COLORS['matter']),
+                                                 to_rgba(COLORS['accent1'])),
+                             edgecolors='black', linewidths=1)
+    ax_ionic.add_collection(ions)
 
     ax_ionic.text(0, -2.5, 'NaCl Crystal Lattice\n(Alternating ions)',
                   fontsize=10, ha='center')
@@ -242,7 +245,9 @@ def generate_ionic_bonding():
              bbox=dict(boxstyle='round,pad=0.5', facecolor='white',
                       edgecolor='gray', alpha=0.9))
 
-    plt.tight_layout(rect=[0, 0.05, 1, 0.96])
+    # Margins as measured from tight_layout(rect=[0, 0.05, 1, 0.96])
+    fig.subplots_adjust(left=0.013, right=0.988, bottom=0.073, top=0.893,
+                        hspace=0.143)
 
     return fig
 
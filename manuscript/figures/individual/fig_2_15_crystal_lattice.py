@@ -9,16 +9,58 @@ Shows various lattice types and their flux field patterns.
 
 import numpy as np
 import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
-from mpl_toolkits.mplot3d.art3d import Poly3DCollection
-from matplotlib.patches import Circle, Rectangle
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
+from matplotlib.collections import EllipseCollection
+from matplotlib.colors import BoundaryNorm, to_rgba
 import matplotlib.patches as mpatches
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.style import COLORS, apply_trd_style
+from utils.style import COLORS
+
+
+@lru_cache(maxsize=4)
+def _flux_field(cells):
+    """
+    Net flux of the 5x5 alternating-charge lattice on a regular grid.
+
+    Parameters
+    ----------
+    cells : int
+        Grid steps per lattice spacing, so every atom sits on a grid node
+
+    Returns
+    -------
+    X, Y, flux : numpy.ndarray
+        Grid coordinates and net flux, read-only since they are cached
+    """
+    x_grid = np.linspace(-0.5, 4.5, 5 * cells + 1)
+    y_grid = np.linspace(-0.5, 4.5, 5 * cells + 1)
+    X, Y = np.meshgrid(x_grid, y_grid)
+
+    # Every atom contributes the same 1/r^2 stencil, just translated, so it
+    # is evaluated once and each atom adds a shifted slice of it. Clamping
+    # r^2 at 0.01 matches clamping r at 0.1.
+    reach = 4 * cells + cells // 2
+    d = np.arange(-reach, reach + 1) / cells
+    stencil = 1 / np.maximum(d[:, None]**2 + d**2, 0.01)
+
+    flux = np.zeros_like(X)
+    size = X.shape[0]
+    for i in range(5):
+        for j in range(5):
+            # Alternating positive/negative contributions
+            sign = 1 if (i + j) % 2 == 0 else -1
+            r0 = reach - cells // 2 - j * cells
+            c0 = reach - cells // 2 - i * cells
+            flux += sign * stencil[r0:r0 + size, c0:c0 + size]
+
+    for arr in (X, Y, flux):
+        arr.flags.writeable = False
+    return X, Y, flux
 
 
 def generate_crystal_lattice():
@@ -29,13 +71,22 @@ def generate_crystal_lattice():
     1. Left: 3D cubic lattice
     2. Right: 2D lattice with flux field overlay
     """
-    fig = plt.figure(figsize=(14, 7), dpi=150)
+    fig = plt.figure(figsize=(13.2, 7.38))
     fig.patch.set_facecolor(COLORS['background'])
 
+    # The 3D panel is a square box; the 2D panel's column also holds the
+    # colorbar. Margins and widths as measured from the old tight-bbox crop
+    # of a 14 x 7 figure, so both panels keep their size, with 0.4 in more
+    # at the bottom so the caption clears the x-axis label.
+    gs = fig.add_gridspec(1, 2, width_ratios=[5.327, 6.523], wspace=0.191,
+                          left=0.015, right=0.999, bottom=0.134, top=0.856)
+
     # 3D subplot
-    ax3d = fig.add_subplot(121, projection='3d')
+    # Draw order follows zorder (bonds under atoms) rather than projected
+    # depth, which would put the single bond collection over the atoms
+    ax3d = fig.add_subplot(gs[0], projection='3d', computed_zorder=False)
     # 2D subplot
-    ax2d = fig.add_subplot(122)
+    ax2d = fig.add_subplot(gs[1])
 
     # =========================================================================
     # Left: 3D Cubic Lattice
@@ -44,24 +95,21 @@ def generate_crystal_lattice():
     n = 3  # 3x3x3 lattice
     spacing = 1.0
 
-    # Two types of atoms for NaCl structure
-    for i in range(n):
-        for j in range(n):
-            for k in range(n):
-                x, y, z = i * spacing, j * spacing, k * spacing
-
-                # Alternating atom types
-                if (i + j + k) % 2 == 0:
-                    color = COLORS['matter']
-                    size = 80
-                else:
-                    color = COLORS['accent1']
-                    size = 100
-
-                ax3d.scatter(x, y, z, c=color, s=size, edgecolors='black',
-                            linewidth=0.5)
-
-    # Draw bonds (nearest neighbors)
+    # Two types of atoms for NaCl structure, alternating by index parity.
+    # A single scatter keeps the atoms depth-sorted against each other;
+    # depth shading stays off as it was for the former single-point calls.
+    I, J, K = np.meshgrid(np.arange(n), np.arange(n), np.arange(n), indexing='ij')
+    coords = np.stack([I, J, K], axis=-1).reshape(-1, 3) * spacing
+    is_cation = (I + J + K).ravel() % 2 == 0
+
+    ax3d.scatter(*coords.T,
+                 c=np.where(is_cation[:, None], to_rgba(COLORS['matter']),
+                            to_rgba(COLORS['accent1'])),
+                 s=np.where(is_cation, 80, 100), edgecolors='black',
+                 linewidth=0.5, depthshade=False, zorder=2)
+
+    # Draw bonds (nearest neighbors), collected into one Line3DCollection
+    bonds = []
     for i in range(n):
         for j in range(n):
             for k in range(n):
@@ -69,14 +117,14 @@ def generate_crystal_lattice():
 
                 # Connect to neighbors
                 if i < n - 1:
-                    ax3d.plot([x, x+spacing], [y, y], [z, z], 'k-',
-                             linewidth=0.5, alpha=0.5)
+                    bonds.append([(x, y, z), (x + spacing, y, z)])
                 if j < n - 1:
-                    ax3d.plot([x, x], [y, y+spacing], [z, z], 'k-',
-                             linewidth=0.5, alpha=0.5)
+                    bonds.append([(x, y, z), (x, y + spacing, z)])
                 if k < n - 1:
-                    ax3d.plot([x, x], [y, y], [z, z+spacing], 'k-',
-                             linewidth=0.5, alpha=0.5)
+                    bonds.append([(x, y, z), (x, y, z + spacing)])
+
+    ax3d.add_collection3d(Line3DCollection(bonds, colors='k', linewidths=0.5,
+                                           alpha=0.5, zorder=1))
 
     ax3d.set_xlabel('x')
     ax3d.set_ylabel('y')
@@ -95,42 +143,32 @@ def generate_crystal_lattice():
     ax2d.set_ylim(-0.5, 4.5)
     ax2d.set_aspect('equal')
 
-    # Create flux field visualization
-    x_grid = np.linspace(-0.5, 4.5, 50)
-    y_grid = np.linspace(-0.5, 4.5, 50)
-    X, Y = np.meshgrid(x_grid, y_grid)
-
-    # Calculate flux from all atoms
-    flux = np.zeros_like(X)
+    atom_idx = np.arange(5)
+    X, Y, flux = _flux_field(cells=10)
 
-    for i in range(5):
-        for j in range(5):
-            # Distance from each atom
-            r = np.sqrt((X - i)**2 + (Y - j)**2)
-            r = np.maximum(r, 0.1)  # Avoid division by zero
-
-            # Alternating positive/negative contributions
-            sign = 1 if (i + j) % 2 == 0 else -1
-            flux += sign / r**2
-
-    # Plot flux field as contours
+    # Plot flux field as a banded raster rather than 20 filled contour
+    # levels. Values beyond +/-5 map to transparent, leaving the same blank
+    # halos around each atom that contourf left outside its level range.
     levels = np.linspace(-5, 5, 21)
-    contour = ax2d.contourf(X, Y, flux, levels=levels, cmap='RdBu_r', alpha=0.4)
-    ax2d.contour(X, Y, flux, levels=[0], colors='black', linewidths=1)
-
-    # Draw atoms
-    for i in range(5):
-        for j in range(5):
-            if (i + j) % 2 == 0:
-                color = COLORS['matter']
-                size = 0.15
-            else:
-                color = COLORS['accent1']
-                size = 0.18
-
-            atom = Circle((i, j), size, facecolor=color,
-                         edgecolor='black', linewidth=1, zorder=5)
-            ax2d.add_patch(atom)
+    cmap = plt.get_cmap('RdBu_r').with_extremes(over='none', under='none')
+    contour = ax2d.imshow(flux, origin='lower', extent=[-0.5, 4.5, -0.5, 4.5],
+                          cmap=cmap, norm=BoundaryNorm(levels, cmap.N),
+                          alpha=0.4, interpolation='bilinear')
+    ax2d.contour(X, Y, flux, levels=[0], colors='black', linewidths=1,
+                 algorithm='serial')
+
+    # Draw atoms as one collection, cations where (i + j) is even
+    I2, J2 = np.meshgrid(atom_idx, atom_idx, indexing='ij')
+    is_cation_2d = ((I2 + J2) % 2 == 0).ravel()
+    diameters = np.where(is_cation_2d, 0.3, 0.36)
+    atoms = EllipseCollection(diameters, diameters, 0, units='xy',
+                              offsets=np.column_stack([I2.ravel(), J2.ravel()]),
+                              offset_transform=ax2d.transData,
+                              facecolors=np.where(is_cation_2d[:, None],
+                                                  to_rgba(COLORS['matter']),
+                                                  to_rgba(COLORS['accent1'])),
+                              edgecolors='black', linewidths=1, zorder=5)
+    ax2d.add_collection(atoms)
 
     ax2d.set_xlabel('x (lattice units)')
     ax2d.set_ylabel('y (lattice units)')
@@ -154,25 +192,22 @@ def generate_crystal_lattice():
     # Overall
     # =========================================================================
     fig.suptitle('Crystal Lattice: Periodic Flux Equilibrium Creates Order',
-                fontsize=16, fontweight='bold', y=0.98)
+                fontsize=16, fontweight='bold', y=0.986)
 
     explanation = (
         "Crystal structures emerge when flux field equilibria repeat periodically.\n"
         "Each atom sits at a flux minimum, with neighbors arranged to minimize total energy."
     )
-    fig.text(0.5, 0.02, explanation, ha='center', fontsize=10,
+    fig.text(0.5, 0.023, explanation, ha='center', va='bottom', fontsize=10,
              bbox=dict(boxstyle='round,pad=0.5', facecolor='white',
                       edgecolor='gray', alpha=0.9))
 
-    plt.tight_layout(rect=[0, 0.06, 1, 0.95])
-
     return fig
 
 
 if __name__ == '__main__':
     fig = generate_crystal_lattice()
     output_path = Path(__file__).parent.parent / 'ch04' / 'fig_2_15_crystal_lattice.png'
-    fig.savefig(output_path, dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
+    fig.savefig(output_path, dpi=150, facecolor='white', edgecolor='none')
     print(f"Saved: {output_path}")
     plt.close(fig)
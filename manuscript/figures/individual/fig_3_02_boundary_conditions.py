@@ -5,9 +5,8 @@ Visualizes different boundary condition types:
 toroidal (periodic), absorbing, and reflective.
 """
 
-import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.patches import Rectangle, FancyArrowPatch, Circle
+from matplotlib.patches import Rectangle, Circle
 import sys
 from pathlib import Path
 
@@ -18,7 +17,7 @@ from utils.style import COLORS
 
 def generate_boundary_conditions():
     """Generate the boundary conditions visualization."""
-    fig, axes = plt.subplots(1, 3, figsize=(14, 5), dpi=150)
+    fig, axes = plt.subplots(1, 3, figsize=(14, 5))
     fig.patch.set_facecolor(COLORS['background'])
 
     titles = ['Toroidal (Periodic)', 'Absorbing', 'Reflective']
@@ -77,7 +76,9 @@ def generate_boundary_conditions():
 
     fig.suptitle('Boundary Conditions for Finite Lattice', fontsize=14, fontweight='bold')
 
-    plt.tight_layout()
+    # Margins as measured from tight_layout()
+    fig.subplots_adjust(left=0.011, right=0.989, bottom=0.030, top=0.901,
+                        wspace=0.056)
     return fig
 
 
@@ -85,7 +86,6 @@ if __name__ == '__main__':
     fig = generate_boundary_conditions()
     output_path = Path(__file__).parent.parent / 'ch01' / 'fig_3_2_boundary_conditions.png'
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(output_path, dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
+    fig.savefig(output_path, dpi=150, facecolor='white', edgecolor='none')
     print(f"Saved: {output_path}")
     plt.close(fig)
@@ -7,7 +7,7 @@ showing how spin emerges from framed flux orientation.
 
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.patches import Circle, FancyArrowPatch, Wedge
+from matplotlib.patches import Circle
 import sys
 from pathlib import Path
 
@@ -18,7 +18,7 @@ from utils.style import COLORS
 
 def generate_spin_states():
     """Generate the spin states visualization."""
-    fig, axes = plt.subplots(1, 3, figsize=(14, 5), dpi=150)
+    fig, axes = plt.subplots(1, 3, figsize=(13.03, 5.03))
     fig.patch.set_facecolor(COLORS['background'])
 
     # Left: Spin up
@@ -71,16 +71,13 @@ def generate_spin_states():
     ax.add_patch(Circle((0, 0), 0.5, facecolor=COLORS['highlight'], edgecolor='black',
                         linewidth=2))
 
-    # Multiple flux direction indicators
-    for angle in [0, 60, 120, 180, 240, 300]:
-        rad = np.radians(angle)
-        x1 = 0.6 * np.cos(rad)
-        y1 = 0.6 * np.sin(rad)
-        x2 = 1.2 * np.cos(rad)
-        y2 = 1.2 * np.sin(rad)
-        ax.annotate('', xy=(x2, y2), xytext=(x1, y1),
-                   arrowprops=dict(arrowstyle='->', color=COLORS['accent1'], lw=1.5,
-                                  alpha=0.7))
+    # Multiple flux direction indicators, 0.6 to 1.2 from the centre, as
+    # one quiver in data units
+    angles = np.radians([0, 60, 120, 180, 240, 300])
+    c, s = 0.6 * np.cos(angles), 0.6 * np.sin(angles)
+    ax.quiver(c, s, c, s, angles='xy', scale_units='xy', scale=1,
+              units='xy', width=0.02, headwidth=4, headlength=4.5,
+              headaxislength=4, color=COLORS['accent1'], alpha=0.7)
 
     ax.text(0, -1.7, 'Spin = net rotation\nof flux frame', fontsize=10, ha='center')
 
@@ -88,12 +85,15 @@ def generate_spin_states():
                 fontsize=14, fontweight='bold', y=0.98)
 
     # Bottom explanation
-    fig.text(0.5, 0.02, 'In TRD, spin emerges from the handedness of the flux frame. '
+    fig.text(0.5, 0.037, 'In TRD, spin emerges from the handedness of the flux frame. '
             '720 degree rotation returns to original state (spinor behavior).',
             fontsize=10, ha='center',
             bbox=dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor='gray'))
 
-    plt.tight_layout(rect=[0, 0.08, 1, 0.93])
+    # Margins as measured from the old bbox_inches='tight' crop of a 14 x 5
+    # figure; the equal-aspect panels fill their slots, so they keep their size
+    fig.subplots_adjust(left=0.008, right=0.992, bottom=0.116, top=0.832,
+                        wspace=0.280)
     return fig
 
 
@@ -101,7 +101,6 @@ if __name__ == '__main__':
     fig = generate_spin_states()
     output_path = Path(__file__).parent.parent / 'ch02' / 'fig_3_7_spin_states.png'
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(output_path, dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
+    fig.savefig(output_path, dpi=150, facecolor='white', edgecolor='none')
     print(f"Saved: {output_path}")
     plt.close(fig)
@@ -6,20 +6,30 @@ when field stress exceeds a threshold.
 """
 
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # figures are only saved, never shown
 import matplotlib.pyplot as plt
-from matplotlib.patches import Circle, FancyArrowPatch, Rectangle
+from matplotlib.collections import EllipseCollection
+from matplotlib.patches import Rectangle
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.style import COLORS
+from utils.style import COLORS, prepare_figure
 
 
-def generate_weak_interaction():
-    """Generate the weak interaction mechanism visualization."""
-    fig, axes = plt.subplots(1, 2, figsize=(14, 6), dpi=150)
-    fig.patch.set_facecolor(COLORS['background'])
+def generate_weak_interaction(fig=None):
+    """
+    Generate the weak interaction mechanism visualization.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure, optional
+        Existing figure to clear and draw into (for batch builds).
+    """
+    fig, axes = prepare_figure(fig, 1, 2, figsize=(14, 6),
+                               facecolor=COLORS['background'])
 
     # Left: Beta decay process
     ax = axes[0]
@@ -32,14 +42,6 @@ def generate_weak_interaction():
     ax.text(2, 7, 'Before:', fontsize=11, fontweight='bold')
     ax.text(2, 6.3, 'Neutron (udd)', fontsize=10)
 
-    # Draw three quarks
-    ax.add_patch(Circle((1, 5), 0.3, facecolor='#FF6B6B', edgecolor='black'))
-    ax.text(1, 5, 'u', fontsize=10, ha='center', va='center', color='white')
-    ax.add_patch(Circle((2, 5), 0.3, facecolor='#4ECDC4', edgecolor='black'))
-    ax.text(2, 5, 'd', fontsize=10, ha='center', va='center', color='white')
-    ax.add_patch(Circle((3, 5), 0.3, facecolor='#4ECDC4', edgecolor='black'))
-    ax.text(3, 5, 'd', fontsize=10, ha='center', va='center', color='white')
-
     # W boson emission
     ax.annotate('', xy=(5, 3.5), xytext=(3.3, 4.7),
                arrowprops=dict(arrowstyle='->', color='purple', lw=2,
@@ -50,19 +52,31 @@ def generate_weak_interaction():
     ax.text(7, 7, 'After:', fontsize=11, fontweight='bold')
     ax.text(7, 6.3, 'Proton (uud)', fontsize=10)
 
-    ax.add_patch(Circle((6, 5), 0.3, facecolor='#FF6B6B', edgecolor='black'))
-    ax.text(6, 5, 'u', fontsize=10, ha='center', va='center', color='white')
-    ax.add_patch(Circle((7, 5), 0.3, facecolor='#FF6B6B', edgecolor='black'))
-    ax.text(7, 5, 'u', fontsize=10, ha='center', va='center', color='white')
-    ax.add_patch(Circle((8, 5), 0.3, facecolor='#4ECDC4', edgecolor='black'))
-    ax.text(8, 5, 'd', fontsize=10, ha='center', va='center', color='white')
-
     # W- decay products
     ax.text(5, 2.8, 'W- decay:', fontsize=10)
-    ax.add_patch(Circle((4.5, 2), 0.25, facecolor=COLORS['antimatter'], edgecolor='black'))
-    ax.text(4.5, 2, 'e-', fontsize=9, ha='center', va='center', color='white')
-    ax.add_patch(Circle((5.5, 2), 0.25, facecolor='#888888', edgecolor='black'))
-    ax.text(5.5, 2, 'v', fontsize=9, ha='center', va='center')
+
+    # Quarks before (udd) and after (uud), then the W- decay products,
+    # drawn as one collection
+    u_color, d_color = '#FF6B6B', '#4ECDC4'
+    particles = [
+        # (x, y), diameter, color, label, label color, label size
+        ((1, 5), 0.6, u_color, 'u', 'white', 10),
+        ((2, 5), 0.6, d_color, 'd', 'white', 10),
+        ((3, 5), 0.6, d_color, 'd', 'white', 10),
+        ((6, 5), 0.6, u_color, 'u', 'white', 10),
+        ((7, 5), 0.6, u_color, 'u', 'white', 10),
+        ((8, 5), 0.6, d_color, 'd', 'white', 10),
+        ((4.5, 2), 0.5, COLORS['antimatter'], 'e-', 'white', 9),
+        ((5.5, 2), 0.5, '#888888', 'v', 'black', 9),
+    ]
+    centers, diameters, colors, *_ = zip(*particles)
+    ax.add_collection(EllipseCollection(
+        diameters, diameters, np.zeros(len(particles)), units='xy',
+        offsets=centers, offset_transform=ax.transData,
+        facecolors=colors, edgecolors='black'))
+    for (x, y), _, _, label, label_color, size in particles:
+        ax.text(x, y, label, fontsize=size, ha='center', va='center',
+                color=label_color)
     ax.text(5, 1.3, 'electron + antineutrino', fontsize=9, ha='center')
 
     # Right: TRD mechanism
@@ -99,7 +113,9 @@ def generate_weak_interaction():
     fig.suptitle('Weak Force: Transmutation Under High Field Stress',
                 fontsize=14, fontweight='bold', y=0.98)
 
-    plt.tight_layout(rect=[0, 0, 1, 0.93])
+    # Margins as measured from tight_layout(rect=[0, 0, 1, 0.93])
+    fig.subplots_adjust(left=0.011, right=0.989, bottom=0.025, top=0.812,
+                        wspace=0.022)
     return fig
 
 
@@ -107,7 +123,6 @@ if __name__ == '__main__':
     fig = generate_weak_interaction()
     output_path = Path(__file__).parent.parent / 'ch02' / 'fig_3_9_weak_interaction.png'
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(output_path, dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
+    fig.savefig(output_path, dpi=150, facecolor='white', edgecolor='none')
     print(f"Saved: {output_path}")
     plt.close(fig)
@@ -6,20 +6,61 @@ in TRD.
 """
 
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # figures are only saved, never shown
 import matplotlib.pyplot as plt
+from matplotlib.colors import to_rgb
 from matplotlib.patches import Circle, FancyArrowPatch
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.style import COLORS
+from utils.style import COLORS, prepare_figure
 
 
-def generate_annihilation_sequence():
-    """Generate the annihilation sequence visualization."""
-    fig, axes = plt.subplots(1, 4, figsize=(14, 4), dpi=150)
-    fig.patch.set_facecolor(COLORS['background'])
+@lru_cache(maxsize=4)
+def _flash_rgba(size):
+    """
+    Yellow annihilation flash: four concentric discs composited into one image.
+
+    Parameters
+    ----------
+    size : int
+        Pixels along each side of the [-0.9, 0.9] square
+
+    Returns
+    -------
+    numpy.ndarray
+        (size, size, 4) RGBA image, read-only since it is cached
+    """
+    radii = np.array([0.3, 0.5, 0.7, 0.9])
+    alphas = 0.8 - radii * 0.6
+
+    # Pixel centres; each disc covering a pixel lets (1 - alpha) through
+    centres = (np.arange(size) + 0.5) / size * 1.8 - 0.9
+    rho = np.hypot(*np.meshgrid(centres, centres))
+    transmitted = np.where(rho[..., None] < radii, 1 - alphas, 1).prod(axis=-1)
+
+    rgba = np.empty((size, size, 4))
+    rgba[..., :3] = to_rgb('yellow')
+    rgba[..., 3] = 1 - transmitted
+    rgba.flags.writeable = False
+    return rgba
+
+
+def generate_annihilation_sequence(fig=None):
+    """
+    Generate the annihilation sequence visualization.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure, optional
+        Existing figure to clear and draw into (for batch builds).
+    """
+    fig, axes = prepare_figure(fig, 1, 4, figsize=(14, 4),
+                               facecolor=COLORS['background'])
 
     stages = [
         ('t = 0', 'Approach'),
@@ -67,9 +108,7 @@ def generate_annihilation_sequence():
     # Stage 3: Annihilation
     ax = axes[2]
     # Flash effect
-    for r in [0.3, 0.5, 0.7, 0.9]:
-        ax.add_patch(Circle((0, 0), r, facecolor='yellow', edgecolor='none',
-                           alpha=0.8 - r*0.6))
+    ax.imshow(_flash_rgba(256), extent=[-0.9, 0.9, -0.9, 0.9])
     # Void particles
     ax.add_patch(Circle((-0.3, 0), 0.25, facecolor=COLORS['void'], edgecolor='black',
                         linewidth=1, alpha=0.5))
@@ -81,27 +120,23 @@ def generate_annihilation_sequence():
     ax = axes[3]
     # Two photon waves going opposite directions
     t = np.linspace(0, 1.5, 75)
+    wave = 0.2 * np.sin(15 * t)
 
-    # Photon 1 (left)
-    x1 = -t
-    y1 = 0.2 * np.sin(15 * t)
-    ax.plot(x1, y1, color=COLORS['highlight'], linewidth=2)
+    # Photon 1 (left) and photon 2 (right) share the same wave
+    ax.plot(-t, wave, t, wave, color=COLORS['highlight'], linewidth=2)
     ax.annotate('', xy=(-1.7, 0), xytext=(-1.5, 0),
                arrowprops=dict(arrowstyle='->', color=COLORS['highlight'], lw=2))
-
-    # Photon 2 (right)
-    x2 = t
-    y2 = 0.2 * np.sin(15 * t)
-    ax.plot(x2, y2, color=COLORS['highlight'], linewidth=2)
     ax.annotate('', xy=(1.7, 0), xytext=(1.5, 0),
                arrowprops=dict(arrowstyle='->', color=COLORS['highlight'], lw=2))
 
     ax.text(0, -1.2, 'Energy -> 2 photons\n(511 keV each)', fontsize=9, ha='center')
 
     fig.suptitle('Annihilation: e+ + e- -> 2 Photons (511 keV each)',
-                fontsize=14, fontweight='bold', y=1.02)
+                fontsize=14, fontweight='bold', y=0.98)
 
-    plt.tight_layout()
+    # Margins as measured from tight_layout(rect=[0, 0, 1, 0.92])
+    fig.subplots_adjust(left=0.011, right=0.989, bottom=0.038, top=0.796,
+                        wspace=0.045)
     return fig
 
 
@@ -109,7 +144,6 @@ if __name__ == '__main__':
     fig = generate_annihilation_sequence()
     output_path = Path(__file__).parent.parent / 'ch02' / 'fig_3_11_annihilation_sequence.png'
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(output_path, dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
+    fig.savefig(output_path, dpi=150, facecolor='white', edgecolor='none')
     print(f"Saved: {output_path}")
     plt.close(fig)
@@ -6,20 +6,29 @@ shell filling, derived masses, and patterns.
 """
 
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # figures are only saved, never shown
 import matplotlib.pyplot as plt
-from matplotlib.patches import Rectangle
+from matplotlib.collections import PolyCollection
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.style import COLORS
+from utils.style import COLORS, prepare_figure
 
 
-def generate_periodic_table_trd():
-    """Generate the TRD periodic table visualization."""
-    fig, ax = plt.subplots(figsize=(16, 10), dpi=150)
-    fig.patch.set_facecolor(COLORS['background'])
+def generate_periodic_table_trd(fig=None):
+    """
+    Generate the TRD periodic table visualization.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure, optional
+        Existing figure to clear and draw into (for batch builds).
+    """
+    fig, ax = prepare_figure(fig, figsize=(12.6, 8.15),
+                             facecolor=COLORS['background'])
     ax.set_xlim(0, 18.5)
     ax.set_ylim(0, 10)
     ax.axis('off')
@@ -63,16 +72,17 @@ def generate_periodic_table_trd():
     cell_size = 0.9
     y_offset = 9
 
-    for col, row, symbol, Z, block in elements:
-        x = col - 0.5
-        y = y_offset - row
-
-        # Draw cell
-        rect = Rectangle((x, y), cell_size, cell_size,
-                         facecolor=block_colors[block],
-                         edgecolor='black', linewidth=1)
-        ax.add_patch(rect)
-
+    # All cells go into one collection: unit-square corners scaled to the
+    # cell size and shifted to each cell's lower-left corner
+    square = np.array([(0, 0), (1, 0), (1, 1), (0, 1)])
+    cols, rows = np.array([(col, row) for col, row, *_ in elements]).T
+    corners = np.column_stack([cols - 0.5, y_offset - rows])
+    cell_colors = [block_colors[block] for *_, block in elements]
+    ax.add_collection(PolyCollection(corners[:, None] + cell_size * square,
+                                     facecolors=cell_colors,
+                                     edgecolors='black', linewidths=1))
+
+    for (_, _, symbol, Z, _), (x, y) in zip(elements, corners):
         # Element symbol
         ax.text(x + cell_size/2, y + cell_size/2 + 0.1, symbol,
                 fontsize=12, fontweight='bold', ha='center', va='center')
@@ -83,9 +93,12 @@ def generate_periodic_table_trd():
 
     # Legend
     ax.text(0.5, 0.8, 'Block Colors:', fontsize=10, fontweight='bold')
-    for i, (block, color) in enumerate(block_colors.items()):
-        ax.add_patch(Rectangle((2 + i*2, 0.5), 0.8, 0.5, facecolor=color,
-                               edgecolor='black'))
+    swatches = [square * (0.8, 0.5) + (2 + i*2, 0.5)
+                for i in range(len(block_colors))]
+    ax.add_collection(PolyCollection(swatches,
+                                     facecolors=list(block_colors.values()),
+                                     edgecolors='black', linewidths=1))
+    for i, block in enumerate(block_colors):
         ax.text(2.4 + i*2, 0.75, f'{block}-block', fontsize=9, ha='left', va='center')
 
     # TRD interpretation
@@ -102,6 +115,9 @@ def generate_periodic_table_trd():
     ax.set_title('Periodic Table: TRD Shell Structure View',
                 fontsize=14, fontweight='bold')
 
+    # Margins as measured from the old bbox_inches='tight' crop of a 16 x 10
+    # figure, so the axes keep their 12.4 x 7.7 inch size
+    fig.subplots_adjust(left=0.008, right=0.992, bottom=0.012, top=0.957)
     return fig
 
 
@@ -109,7 +125,6 @@ if __name__ == '__main__':
     fig = generate_periodic_table_trd()
     output_path = Path(__file__).parent.parent / 'ch03' / 'fig_3_14_periodic_table_trd.png'
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(output_path, dpi=150, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
+    fig.savefig(output_path, dpi=150, facecolor='white', edgecolor='none')
     print(f"Saved: {output_path}")
     plt.close(fig)
@@ -9,10 +9,12 @@ from .style import (
     FORCE_COLORS,
     MODE_COLORS,
     FONTS,
+    BBOX_STYLES,
     FIGURE_SIZES,
     DPI,
     apply_trd_style,
     create_figure,
+    prepare_figure,
 )
 
 from .physics_constants import (
@@ -32,8 +34,9 @@ from .physics_constants import (
 
 __all__ = [
     # Style
-    'COLORS', 'FORCE_COLORS', 'MODE_COLORS', 'FONTS', 'FIGURE_SIZES', 'DPI',
-    'apply_trd_style', 'create_figure',
+    'COLORS', 'FORCE_COLORS', 'MODE_COLORS', 'FONTS', 'BBOX_STYLES',
+    'FIGURE_SIZES', 'DPI',
+    'apply_trd_style', 'create_figure', 'prepare_figure',
     # Physics
     'B3', 'N_C', 'N_EFF', 'N_BASE',
     'ALPHA', 'ALPHA_INV', 'G_STAR', 'KB', 'PHI',
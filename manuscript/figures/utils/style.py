@@ -90,6 +90,15 @@ FONTS = {
     'legend': {'family': 'sans-serif', 'size': 9},
 }
 
+# Text box styles (passed as ``bbox=`` to ax.text / fig.text; matplotlib
+# copies the dict, so these can be shared)
+BBOX_STYLES = {
+    'caption': dict(boxstyle='round,pad=0.5', facecolor='white',
+                    edgecolor='gray', alpha=0.9),   # Figure-level explanation
+    'label': dict(boxstyle='round,pad=0.3', facecolor='white',
+                  alpha=0.9),                       # In-panel equation/label
+}
+
 # =============================================================================
 # FIGURE DIMENSIONS
 # =============================================================================
@@ -188,6 +197,43 @@ def create_figure(figtype='standard', dpi='web', nrows=1, ncols=1):
     return fig, ax
 
 
+def prepare_figure(fig=None, nrows=1, ncols=1, figsize=None, facecolor=None,
+                   **kwargs):
+    """
+    Create a figure with subplots, or clear and reuse an existing one.
+
+    Batch builds can pass the same figure to successive generators so the
+    Figure and its canvas are allocated once rather than per figure.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure, optional
+        Figure to clear and reuse. A new one is created if None.
+    nrows, ncols : int
+        Number of subplot rows/columns
+    figsize : tuple, optional
+        Figure size in inches
+    facecolor : color, optional
+        Figure background color, set when the figure is created
+    **kwargs
+        Passed through to ``subplots`` (e.g. ``height_ratios``)
+
+    Returns
+    -------
+    fig, ax : matplotlib figure and axis/axes
+    """
+    if fig is None:
+        return plt.subplots(nrows, ncols, figsize=figsize, facecolor=facecolor,
+                            **kwargs)
+
+    fig.clear()
+    if figsize is not None:
+        fig.set_size_inches(figsize)
+    if facecolor is not None:
+        fig.set_facecolor(facecolor)
+    return fig, fig.subplots(nrows, ncols, **kwargs)
+
+
 def save_figure(fig, filepath, dpi='web', tight=True):
     """
     Save a figure with standard settings.